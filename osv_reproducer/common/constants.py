@@ -1,10 +1,20 @@
+import platform
 
-# TODO: User-Agent should be dynamic
+from ..core.version import VERSION
 
+# computed once at import, it is sent with every request
 USER_AGENT_HEADERS = {
-    'User-Agent': f'osv-reproducer/1.0.0 Python/3.10'
+    'User-Agent': f'osv-reproducer/{".".join(map(str, VERSION[:3]))} Python/{platform.python_version()}'
 }
 
 HTTP_HEADERS = {
     'Accept': 'application/json', 'Content-type': 'application/json', 'User-Agent': USER_AGENT_HEADERS['User-Agent']
-}
\ No newline at end of file
+}
+
+# Docker platforms for the architectures in OSS-Fuzz job types, anything else (e.g., i386) runs on amd64 images
+ARCHITECTURE_PLATFORMS = {
+    'x86_64': 'linux/amd64', 'aarch64': 'linux/arm64', 'arm64': 'linux/arm64'
+}
+
+# bounded json-file logs for the build and runner containers, only the tail of the output is ever inspected
+CONTAINER_LOG_CONFIG = {'type': 'json-file', 'config': {'max-size': '1m', 'max-file': '3'}}
@@ -54,13 +54,16 @@ class Base(Controller):
             file_provision_handler._setup(self.app)
 
             docker_handler = self.app.handler.get("handlers", "docker", setup=True)
+            handlers_config = self.app.config.get_section_dict("handlers")
 
             context_service = ContextService(
                 file_provision_handler=file_provision_handler,
                 github_handler=self.app.handler.get("handlers", "github", setup=True),
                 osv_handler=self.app.handler.get("handlers", "osv", setup=True),
                 oss_fuzz_handler=self.app.handler.get("handlers", "oss_fuzz", setup=True),
-                gcs_handler=self.app.handler.get("handlers", "gcs", setup=True)
+                gcs_handler=self.app.handler.get("handlers", "gcs", setup=True),
+                revalidate_snapshots=(handlers_config.get("gcs") or {}).get("revalidate_snapshots", False),
+                revalidate_issue_reports=(handlers_config.get("oss_fuzz") or {}).get("revalidate_issue_reports", False)
             )
 
             builder_service = BuilderService(
@@ -7,7 +7,7 @@ class DockerInterface(ABC):
     @abstractmethod
     def build_image(
             self, context_path: Path, tag: str, build_args: Optional[Dict[str, str]] = None,
-            remove_containers: bool = True, **kwargs
+            remove_containers: bool = True, cache_from: Optional[List[str]] = None, **kwargs
     ) -> Optional[str]:
         """
         An abstract method that defines the interface for building a container image. This method
@@ -21,6 +21,8 @@ class DockerInterface(ABC):
                 customizing the image build process.
             remove_containers (bool): Indicates whether intermediate containers created
                 during the build process should be removed.
+            cache_from (Optional[List[str]]): Images whose layers can be reused as build
+                cache, e.g., images pulled from a registry on a previous run.
             **kwargs: Additional keyword arguments for extended functionality.
 
         Raises:
@@ -120,7 +122,8 @@ class DockerInterface(ABC):
             self, image: str, container_name: str, command: Optional[List[str]] = None,
             environment: Optional[Dict[str, str]] = None, volumes: Optional[Dict[str, Dict[str, str]]] = None,
             platform: str = 'linux/amd64', privileged: bool = True, shm_size: str = '2g', detach: bool = True,
-            tty: bool = False, stdin_open: bool = True, remove: bool = False,
+            tty: bool = False, stdin_open: bool = True, remove: bool = False, init: bool = False,
+            log_config: Optional[Dict] = None
     ) -> Optional[str]:
         """
         An abstract method for running containers based on a given image. This method is expected
@@ -144,6 +147,10 @@ class DockerInterface(ABC):
             tty (bool): Whether to allocate a TTY for the container. Defaults to False.
             stdin_open (bool): Whether to keep STDIN open even if not attached. Defaults to True.
             remove (bool): Whether to automatically remove the container when it exits. Defaults to False.
+            init (bool): Whether to run an init process as PID 1 that forwards signals and reaps zombies.
+                Defaults to False.
+            log_config (Optional[Dict]): The logging driver configuration for the container, e.g., to cap the size
+                of its log file. Defaults to None (the daemon's default).
 
         Returns:
             Optional[str]: The identifier of the started container if successful, otherwise None.
@@ -154,7 +161,7 @@ class DockerInterface(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def stream_container_logs(self, container_name: str) -> List[str]:
+    def stream_container_logs(self, container_name: str, max_lines: Optional[int] = None) -> List[str]:
         """
         Abstract method to stream logs from a container.
 
@@ -165,11 +172,13 @@ class DockerInterface(ABC):
         Parameters:
         container_name : str
             The identifier or name of the container whose logs are to be streamed.
+        max_lines : Optional[int]
+            The number of trailing lines to keep; all lines are kept when None.
 
         Returns:
         List[str]
             A list of strings where each string represents a line of the container's
-            log output.
+            log output (the last max_lines when bounded).
         """
         raise NotImplementedError()
 
@@ -27,7 +27,7 @@ class FileProvisionInterface(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def save_osv_record(self, osv: OSV) -> Optional[Path]:
+    def save_osv_record(self, osv: OSV, content: Optional[bytes] = None) -> Optional[Path]:
         """
         An abstract method to save an OSV record. This function is meant to be
         overridden in subclasses, enabling implementation-specific logic
@@ -38,6 +38,8 @@ class FileProvisionInterface(ABC):
         Args:
             osv (OSV): An instance of the OSV class representing an
                 Open Software Vulnerability record that needs to be saved.
+            content (Optional[bytes]): The raw JSON document the record was parsed
+                from. When given, it is stored as is instead of re-serializing the record.
 
         Returns:
             Optional[Path]: Returns the file path to the saved OSV record
@@ -51,7 +53,7 @@ class FileProvisionInterface(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def get_testcase_path(self, testcase_id: int) -> Optional[Path]:
+    def get_testcase_path(self, testcase_id: int, check: bool = True) -> Optional[Path]:
         """
         Provides the interface definition for obtaining the file path of a
         test case based on its identifier. This method must be implemented
@@ -62,6 +64,8 @@ class FileProvisionInterface(ABC):
         path is required. It should be a unique integer that allows locating
         the test case within the system.
         @type testcase_id: int
+        @param check: Whether to only return the path if the file exists.
+        @type check: bool
 
         @return: The file path of the test case if it exists, or None if the
         path cannot be determined.
@@ -130,7 +134,20 @@ class FileProvisionInterface(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def save_issue_report(self, issue_report: OSSFuzzIssueReport) -> Path:
+    def load_issue_report_validators(self, issue_id: int) -> Optional[Dict[str, str]]:
+        """
+        Load the HTTP validators (ETag / Last-Modified) recorded for a cached issue report.
+
+        Args:
+            issue_id (int): The identifier of the issue report.
+
+        Returns:
+            Optional[Dict[str, str]]: The validators, or None if they were not recorded.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def save_issue_report(self, issue_report: OSSFuzzIssueReport, validators: Optional[Dict[str, str]] = None) -> Path:
         """
         An abstract method to save an issue report to a specified location. The method
         is intended to be implemented in any subclass and must handle the logic of saving
@@ -141,6 +158,7 @@ class FileProvisionInterface(ABC):
 
         Args:
             issue_report (OSSFuzzIssueReport): The issue report that needs to be saved.
+            validators (Optional[Dict[str, str]]): HTTP validators of the response, stored alongside it when given.
 
         Returns:
             Path: The file path where the issue report has been saved.
@@ -212,7 +230,7 @@ class FileProvisionInterface(ABC):
                 The unique identifier for an issue.
 
         Returns:
-            None
+            None. The mapping may be persisted later, persistence errors are only logged.
 
         Raises:
             NotImplementedError
@@ -244,7 +262,7 @@ class FileProvisionInterface(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def set_oss_fuzz_repo_sha(self, timestamp: str, oss_fuzz_repo_sha: str) -> bool:
+    def set_oss_fuzz_repo_sha(self, timestamp: str, oss_fuzz_repo_sha: str) -> None:
         """
         Sets the OSS-Fuzz repository SHA for a given timestamp.
 
@@ -261,13 +279,12 @@ class FileProvisionInterface(ABC):
                 the given timestamp.
 
         Returns:
-            bool
-                Returns True if the operation is successful, otherwise False.
+            None. The mapping may be persisted later, persistence errors are only logged.
         """
         raise NotImplementedError()
 
     @abstractmethod
-    def set_osv_timestamp(self, osv_id: str, timestamp: str) -> bool:
+    def set_osv_timestamp(self, osv_id: str, timestamp: str) -> None:
         """
         An abstract method that is required to be implemented in subclasses. It is used to
         set the timestamp for a given OSV (Open Source Vulnerability) identifier. This
@@ -281,7 +298,7 @@ class FileProvisionInterface(ABC):
                 specified OSV.
 
         Returns:
-            A boolean indicating the success or failure of the operation.
+            None. The mapping may be persisted later, persistence errors are only logged.
 
         Raises:
             NotImplementedError: Raised if the subclass does not implement this abstract
@@ -349,7 +366,24 @@ class FileProvisionInterface(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def save_snapshot(self, srcmap: dict, project_name: str, sanitizer: str, timestamp: str) -> Path:
+    def load_snapshot_generation(self, project_name: str, sanitizer: str, timestamp: str) -> Optional[int]:
+        """
+        Load the GCS blob generation recorded for a cached snapshot.
+
+        Args:
+            project_name: Name of the OSS-Fuzz project.
+            sanitizer: Name of the sanitizer.
+            timestamp: Timestamp of the build.
+
+        Returns:
+            Optional[int]: The blob generation, or None if it was not recorded.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def save_snapshot(
+            self, srcmap: dict, project_name: str, sanitizer: str, timestamp: str, generation: Optional[int] = None
+    ) -> Path:
         """
         Save the snapshot to a file.
 
@@ -358,6 +392,7 @@ class FileProvisionInterface(ABC):
             project_name: Name of the OSS-Fuzz project.
             sanitizer: Name of the sanitizer.
             timestamp: Timestamp to use in the filename.
+            generation: GCS blob generation of the srcmap, stored alongside it when given.
 
         Returns:
             Path: Path to the saved snapshot file.
@@ -1,6 +1,6 @@
 from datetime import datetime
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Union
+from typing import Optional, Tuple, Union, Iterator
 
 
 # Google Cloud Storage (GCS)
@@ -23,17 +23,19 @@ class GCSInterface(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def list_blobs_with_prefix(self, bucket_name: str, prefix: str, start_offset: Optional[str] = None) -> list:
+    def list_blobs_with_prefix(
+            self, bucket_name: str, prefix: str, start_offset: Optional[str] = None
+    ) -> Iterator[str]:
         """
-        List blobs in a bucket with a specific prefix.
+        Lazily list blobs in a bucket with a specific prefix, in lexicographic order.
 
         Args:
             bucket_name: Name of the GCS bucket.
             prefix: Prefix used to filter blobs.
             start_offset: Filter results to objects whose names are lexicographically equal to or after this value.
 
-        Returns:
-            list: List of blob names.
+        Yields:
+            str: Blob names.
 
         Raises:
             GCSError: If listing blobs fails.
@@ -64,6 +66,29 @@ class GCSInterface(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def fetch_snapshot_if_modified(
+            self, project_name: str, sanitizer: str, timestamp: str, generation: Optional[int] = None
+    ) -> Tuple[Optional[dict], Optional[int]]:
+        """
+        Conditionally fetches the snapshot for a specified project and sanitizer at a given timestamp.
+
+        The download is skipped when the generation of the stored blob still matches the generation
+        of a previously downloaded copy, which allows callers to revalidate cached snapshots without
+        transferring their content again.
+
+        Parameters:
+            project_name (str): The name of the project for which snapshot data is requested.
+            sanitizer (str): The identifier of the sanitizer associated with the project's data.
+            timestamp (str): The timestamp for which the snapshot is requested.
+            generation (Optional[int]): The generation of the cached copy, if any.
+
+        Returns:
+            Tuple[Optional[dict], Optional[int]]: The snapshot data and its generation. The snapshot
+                is None when unchanged (with the given generation) or unavailable (with None).
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def fetch_snapshot_by_range(
             self, project_name: str,  sanitizer: str, start_timestamp: Union[str, datetime], end_timestamp: Union[str, datetime]
@@ -85,6 +85,25 @@ class GithubInterface(ABC):
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_commit_dates(self, commits: List[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], Optional[datetime]]:
+        """
+        Abstract method to retrieve the commit dates of several commits at once.
+
+        Implementations should resolve all the given commits with as few remote requests as
+        possible (e.g., a single batched query), falling back to individual lookups when needed.
+
+        Parameters:
+           commits: List[Tuple[str, str, str]]
+               The (owner, project, version) tuples identifying each commit.
+
+        Returns:
+           Dict[Tuple[str, str, str], Optional[datetime]]
+               A mapping from each (owner, project, version) tuple to the commit's date,
+               or None if the commit does not exist.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def clone_repository(self, repo_url: str, commit: str, to_path: Path, shallow: bool = True) -> Optional[Path]:
         """
@@ -1,21 +1,23 @@
+from pathlib import Path
 from abc import abstractmethod
 from pydantic import AnyHttpUrl
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Dict
 
 from ...core.models import OSSFuzzIssueReport
 
 
 class OSSFuzzInterface:
     @abstractmethod
-    def fetch_test_case_content(self, url: AnyHttpUrl) -> Optional[bytes]:
+    def fetch_test_case(self, url: AnyHttpUrl, to_path: Path) -> Optional[Path]:
         """
-        Retrieves the content of a test case from a URL without saving it.
+        Downloads a test case from a URL, streaming its content directly to a file.
 
         Args:
             url (AnyHttpUrl): The URL to download the test case from.
+            to_path (Path): The file to write the test case to.
 
         Returns:
-            Optional[bytes]: The content of the test case, or None if the download failed.
+            Optional[Path]: The path of the saved test case, or None if the download failed.
         """
         raise NotImplementedError()
 
@@ -41,6 +43,27 @@ class OSSFuzzInterface:
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def fetch_issue_report_if_modified(
+            self, issue_id: int, validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[OSSFuzzIssueReport], Optional[Dict[str, str]]]:
+        """
+        Conditionally fetches the detailed issue report for a given OSSFuzz issue ID.
+
+        The validators (ETag / Last-Modified) of a previous response are sent along with
+        the request, so an unchanged issue is answered without transferring its page again.
+
+        Args:
+            issue_id (int): The unique identifier of the OSSFuzz issue to fetch.
+            validators (Optional[Dict[str, str]]): The validators of a previous response, if any.
+
+        Returns:
+            Tuple[Optional[OSSFuzzIssueReport], Optional[Dict[str, str]]]: The issue report and the
+            validators of the response. The issue report is None when unchanged (with the given
+            validators) or unavailable (with None).
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def fetch_issue_id(self, url: str) -> Tuple[str, int]:
         """
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple, Dict
 from abc import abstractmethod
 
 from osvutils.types.osv import OSV
@@ -7,7 +7,7 @@ from ..models import ProjectRange
 
 class OSVInterface:
     @abstractmethod
-    def fetch_vulnerability(self, osv_id: str) -> OSV:
+    def fetch_vulnerability(self, osv_id: str) -> Tuple[OSV, bytes]:
         """
         An abstract method that retrieves vulnerability data based on an OSV identifier.
 
@@ -20,8 +20,8 @@ class OSVInterface:
             OSV schema.
 
         Returns:
-            OSV: An instance of the OSV class containing detailed information about
-            the requested vulnerability.
+            Tuple[OSV, bytes]: An instance of the OSV class containing detailed information
+            about the requested vulnerability, and the raw JSON document it was parsed from.
 
         Raises:
             NotImplementedError: This method must be implemented in a subclass and will
@@ -29,6 +29,24 @@ class OSVInterface:
         """
         raise NotImplementedError()
 
+    @abstractmethod
+    def fetch_vulnerabilities(self, osv_ids: List[str], max_workers: int = 8) -> Dict[str, Tuple[OSV, bytes]]:
+        """
+        An abstract method that retrieves the vulnerability data of several OSV identifiers at once.
+
+        Args:
+            osv_ids (List[str]): The unique identifiers of the vulnerabilities.
+            max_workers (int): The maximum number of concurrent requests.
+
+        Returns:
+            Dict[str, Tuple[OSV, bytes]]: The record and raw JSON document of each vulnerability,
+            keyed by OSV identifier. Vulnerabilities that could not be retrieved are left out.
+
+        Raises:
+            NotImplementedError: This method must be implemented in a subclass.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def get_project_ranges(self, osv: OSV) -> List[ProjectRange]:
         """
@@ -4,9 +4,10 @@ Module for interacting with Docker.
 import docker
 
 from pathlib import Path
+from collections import deque
 from cement import Handler
 from ast import literal_eval
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from docker.errors import DockerException, APIError
 
 from ..core.exc import DockerError
@@ -24,17 +25,59 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
         super()._setup(app)
         """Initialize the Docker client."""
         try:
+            # negotiating the API version queries the daemon, which doubles as the connection test
             self.client = docker.from_env(timeout=10)
-            # Test connection
-            self.client.ping()
             self.app.log.info("Docker client initialized successfully")
         except DockerException as e:
             self.app.log.error(f"Failed to initialize Docker client: {str(e)}")
             raise DockerError(f"Failed to initialize Docker client: {str(e)}")
 
+        # the section is optional, older configuration files do not have it
+        self.config = self.app.config.get_section_dict("handlers").get("docker") or {}
+        # registry repository holding built images, used as layer cache across runs and machines
+        self.cache_repository = self.config.get("cache_repository")
+        self.push_cache = self.config.get("push_cache", False)
+        # make error codes found in the logs of exited containers, keyed by container id and tail size
+        self._log_error_codes: Dict[Tuple[str, int], Optional[int]] = {}
+
+    def _get_cache_ref(self, tag: str) -> Optional[str]:
+        if not self.cache_repository:
+            return None
+
+        return f"{self.cache_repository.rstrip('/')}/{tag.rpartition(':')[0]}:buildcache"
+
+    def _pull_cache_image(self, cache_ref: str) -> bool:
+        repository, _, tag = cache_ref.rpartition(":")
+
+        try:
+            self.client.images.pull(repository, tag=tag)
+            self.app.log.info(f"Using {cache_ref} as build cache")
+            return True
+        except (DockerException, APIError) as e:
+            self.app.log.info(f"No build cache available at {cache_ref}: {str(e)}")
+
+        return False
+
+    def _push_cache_image(self, image_id: str, cache_ref: str):
+        repository, _, tag = cache_ref.rpartition(":")
+
+        try:
+            self.client.images.get(image_id).tag(repository, tag=tag)
+
+            # push errors are reported in the output stream rather than raised
+            for line in self.client.images.push(repository, tag=tag, stream=True, decode=True):
+                if "error" in line:
+                    self.app.log.warning(f"Failed to push build cache {cache_ref}: {line['error']}")
+                    return
+        except (DockerException, APIError) as e:
+            self.app.log.warning(f"Failed to push build cache {cache_ref}: {str(e)}")
+            return
+
+        self.app.log.info(f"Pushed build cache {cache_ref}")
+
     def build_image(
             self, context_path: Path, tag: str, build_args: Optional[Dict[str, str]] = None,
-            remove_containers: bool = True, **kwargs
+            remove_containers: bool = True, cache_from: Optional[List[str]] = None, **kwargs
     ) -> Optional[str]:
         """
         Build a Docker image.
@@ -44,6 +87,8 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
             tag: Tag for the image.
             build_args: Build arguments.
             remove_containers: Whether to remove intermediate containers.
+            cache_from: Images whose layers can be reused by the build; the configured cache repository image
+                is added when available.
             kwargs: Additional keyword arguments to pass to docker.api.build().
 
         Returns:
@@ -52,6 +97,12 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
         Raises:
             DockerError: If building the image fails.
         """
+        cache_from = list(cache_from or [])
+        cache_ref = self._get_cache_ref(tag)
+
+        if cache_ref and self._pull_cache_image(cache_ref):
+            cache_from.append(cache_ref)
+
         try:
             self.app.log.info(f"Building Docker image {tag}")
 
@@ -62,6 +113,7 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
                 tag=tag,
                 buildargs=build_args,
                 rm=remove_containers,
+                cache_from=cache_from or None,
                 **kwargs
             )
 
@@ -77,6 +129,9 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
             image = self.client.images.get(tag)
             self.app.log.info(f"Successfully built Docker image {tag} with ID {image.id}")
 
+            if cache_ref and self.push_cache:
+                self._push_cache_image(image.id, cache_ref)
+
             return image.id
         except (DockerException, APIError) as e:
             self.app.log.error(f"Failed to build Docker image {tag}: {str(e)}")
@@ -93,8 +148,8 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
 
     def remove_container(self, container_name: str) -> bool:
         try:
-            container = self.client.containers.get(container_name)
-            container.remove(force=True)
+            # the API accepts the name directly, no need to look the container up first
+            self.client.api.remove_container(container_name, force=True)
             self.app.log.info(f"Container {container_name} removed successfully")
             return True
         except docker.errors.NotFound:
@@ -140,7 +195,8 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
             self, image: str, container_name: str, command: Optional[List[str]] = None,
             environment: Optional[Dict[str, str]] = None, volumes: Optional[Dict[str, Dict[str, str]]] = None,
             platform: str = 'linux/amd64', privileged: bool = True, shm_size: str = '2g', detach: bool = True,
-            tty: bool = False, stdin_open: bool = True, remove: bool = False,
+            tty: bool = False, stdin_open: bool = True, remove: bool = False, init: bool = False,
+            log_config: Optional[Dict] = None
     ) -> Optional[str]:
         try:
             self.app.log.info(f"Running container {container_name} with image {image} on command {command}")
@@ -158,7 +214,9 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
                 volumes=volumes,
                 tty=tty,
                 stdin_open=stdin_open,
-                remove=remove
+                remove=remove,
+                init=init,
+                log_config=log_config
             )
 
             if container:
@@ -170,7 +228,7 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
 
         return None
 
-    def stream_container_logs(self, container_name: str) -> List[str]:
+    def stream_container_logs(self, container_name: str, max_lines: Optional[int] = None) -> List[str]:
         try:
             container = self.client.containers.get(container_name)
         except docker.errors.NotFound:
@@ -179,16 +237,30 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
 
         self.app.log.info(f"Streaming logs for container {container.name}:")
 
-        logs = []
+        # only the tail is kept when bounded, build logs can be very long
+        logs = deque(maxlen=max_lines)
+        # chunks are not aligned to lines (nor to UTF-8 characters), keep the incomplete tail until the next one
+        pending = bytearray()
+
+        def _add_lines(data: bytes):
+            for log_bytes in data.split(b'\n'):
+                line = log_bytes.decode('utf-8', errors='replace').strip()
+                if line:  # Only log non-empty lines
+                    logs.append(line)
+                    self.app.log.info(line)
 
-        # Stream logs line by line and manually decode bytes to strings
-        for log_bytes in container.logs(stream=True, follow=True):
-            line = log_bytes.decode('utf-8').strip()
-            if line:  # Only log non-empty lines
-                logs.append(line)
-                self.app.log.info(line)
+        for chunk in container.logs(stream=True, follow=True):
+            pending.extend(chunk)
+            end = pending.rfind(b'\n')
 
-        return logs
+            if end != -1:
+                _add_lines(pending[:end])
+                del pending[:end + 1]
+
+        if pending:
+            _add_lines(pending)
+
+        return list(logs)
 
     def check_container_exit_code(self, container_name: str) -> Optional[int]:
         try:
@@ -261,10 +333,23 @@ class DockerHandler(DockerInterface, HandlersInterface, Handler):
             self.app.log.warning(f"Container {container_name} not found")
             return None
 
-        logs = container.logs(tail=last_n_log_lines).decode("utf-8").strip().split("\n")
+        key = (container.id, last_n_log_lines)
 
-        # if there is an error in the build process, we should find it at the end of the logs
-        error_code = find_make_error(logs)
+        if key in self._log_error_codes:
+            error_code = self._log_error_codes[key]
+        else:
+            # split the raw tail before decoding, the same way streamed logs are turned into lines
+            logs = [
+                line.decode("utf-8", errors="replace").strip()
+                for line in container.logs(tail=last_n_log_lines).splitlines()[-last_n_log_lines:]
+            ]
+
+            # if there is an error in the build process, we should find it at the end of the logs
+            error_code = find_make_error(logs)
+
+            # the logs of an exited container no longer change, a running one may still fail
+            if container.status == "exited":
+                self._log_error_codes[key] = error_code
 
         if error_code:
             self.app.log.warning(f"Previous build failed with error code {error_code}")
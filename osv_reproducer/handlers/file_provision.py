@@ -1,8 +1,15 @@
-import json
+import os
+import mmap
+import atexit
+import functools
+import orjson
+import threading
 
 from pathlib import Path
+from collections import OrderedDict
 from cement import Handler
-from typing import Optional, Dict, List
+from pydantic import BaseModel
+from typing import Optional, Dict, List, Tuple, Type, TypeVar
 
 # TODO: use domain models instead of OSV directly
 from osvutils.types.osv import OSV
@@ -29,11 +36,10 @@ def _load_json_file(file_path: Path, logger: LogInterface) -> dict:
         return {}
 
     try:
-        with file_path.open('r') as f:
-            data = json.load(f)
+        data = orjson.loads(file_path.read_bytes())
         logger.info(f"Loaded mappings from {file_path}")
         return data
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         logger.warning(f"Invalid JSON format in file: {file_path}")
     except Exception as e:
         logger.warning(f"Failed to load file {file_path}: {str(e)}")
@@ -41,6 +47,119 @@ def _load_json_file(file_path: Path, logger: LogInterface) -> dict:
     return {}
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _load_model_file(file_path: Path, model: Type[ModelT], logger: LogInterface) -> Optional[ModelT]:
+    """Helper method to parse and validate a JSON file written from a model in a single pass.
+
+    Args:
+        file_path: Path to the JSON file
+        model: Pydantic model class to validate the content against
+        logger: Cement logger instance
+
+    Returns:
+        The model instance or None if loading fails (silently when the file does not exist)
+    """
+    try:
+        return model.model_validate_json(file_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to load file {file_path}: {str(e)}")
+
+    return None
+
+
+def _load_sidecar_file(file_path: Path, logger: LogInterface) -> Optional[dict]:
+    """Helper method to load the JSON sidecar of a cached file.
+
+    Args:
+        file_path: Path to the sidecar file
+        logger: Cement logger instance
+
+    Returns:
+        Parsed JSON data or None if loading fails (silently when the file does not exist)
+    """
+    try:
+        return orjson.loads(file_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to load file {file_path}: {str(e)}")
+
+    return None
+
+
+def _dump_model(model: BaseModel, **kwargs) -> bytes:
+    """Serialize a model to JSON bytes, same output as model_dump_json without the round-trip through str."""
+    return model.__pydantic_serializer__.to_json(model, **kwargs)
+
+
+def _write_file_atomic(file_path: Path, content: bytes):
+    """Write the content to a temporary sibling and swap it in, so readers never see a partial file."""
+    # unique per process and thread, concurrent writers of the same file must not share the temporary file
+    tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _load_json_file_mmap(file_path: Path, logger: LogInterface) -> dict:
+    """Helper method to parse JSON files through a read-only memory map, avoiding a user-space copy of the file.
+
+    Args:
+        file_path: Path to the JSON file
+        logger: Cement logger instance
+
+    Returns:
+        Parsed JSON data or an empty dict if loading fails
+    """
+    try:
+        with file_path.open('rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+    except orjson.JSONDecodeError:
+        logger.warning(f"Invalid JSON format in file: {file_path}")
+    except Exception as e:
+        logger.warning(f"Failed to load file {file_path}: {str(e)}")
+
+    return {}
+
+
+# Maximum number of OSV records / project infos kept in memory
+MODEL_CACHE_SIZE = 256
+
+
+def _lru_get(cache: OrderedDict, lock: threading.Lock, key):
+    """Return the cached value for key (or None), marking it as the most recently used."""
+    # the lookup and the reordering must not interleave with an eviction from another thread
+    with lock:
+        value = cache.get(key)
+
+        if value is not None:
+            cache.move_to_end(key)
+
+        return value
+
+
+def _lru_put(cache: OrderedDict, lock: threading.Lock, key, value):
+    """Cache value under key, evicting the least recently used entry when the cache is full."""
+    with lock:
+        cache[key] = value
+        cache.move_to_end(key)
+
+        if len(cache) > MODEL_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+# Seconds to wait before writing updated mappings, so bursts of updates are written once
+MAPPINGS_FLUSH_DELAY = 5.0
+
 FILE_STORE_PATHS = [
     "context", "issues", "mappings", "outputs", "projects", "records", "repositories", "snapshots", "testcases",
 ]
@@ -57,6 +176,25 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
         self.osv_issue_ids = {}
         self.osv_timestamp_ids = {}
         self.timestamp_commit_ids = {}
+        # in-process cache of loaded snapshots, keyed by (project_name, sanitizer, timestamp)
+        self._snapshots: Dict[Tuple[str, str, str], dict] = {}
+        # in-process cache of loaded issue reports, keyed by issue id
+        self._issue_reports: Dict[int, OSSFuzzIssueReport] = {}
+        # bounded in-process caches of loaded OSV records and project infos
+        self._osv_records: OrderedDict[str, OSV] = OrderedDict()
+        self._project_infos: OrderedDict[Tuple[str, str], ProjectInfo] = OrderedDict()
+        # guards the in-process caches, the handler is shared by the threads of batch runs
+        self._cache_lock = threading.Lock()
+        # mappings pending to be written to disk, keyed by their file path
+        self._dirty_mappings: Dict[Path, dict] = {}
+        self._flush_timer: Optional[threading.Timer] = None
+        self._mappings_lock = threading.Lock()
+        # memoized project directory paths, keyed by (project_name, oss_fuzz_repo_sha)
+        self._project_path = functools.lru_cache(maxsize=1024)(self._build_project_path)
+        # directories known to exist, the handler never removes them
+        self._existing_dirs = set()
+        # names of the files in each project directory, listed once instead of a stat per file
+        self._project_file_names: Dict[Path, frozenset] = {}
 
     def _init_paths(self):
         # Create base and subdirectories
@@ -69,6 +207,31 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
         self.osv_timestamp_ids_path = self.mappings_path / "osv_timestamp_ids.json"
         self.timestamp_commit_ids_path = self.mappings_path / "timestamp_commit_ids.json"
 
+    def _build_project_path(self, project_name: str, oss_fuzz_repo_sha: str) -> Path:
+        return self.projects_path / project_name / oss_fuzz_repo_sha
+
+    def _make_project_path(self, project_name: str, oss_fuzz_repo_sha: str) -> Path:
+        project_path = self._project_path(project_name, oss_fuzz_repo_sha)
+        self._make_dir(project_path)
+
+        return project_path
+
+    def _make_dir(self, path: Path):
+        if path not in self._existing_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._existing_dirs.add(path)
+
+    def _dir_exists(self, path: Path) -> bool:
+        # only hits are remembered, a missing directory may be created later (e.g., by a clone)
+        if path in self._existing_dirs:
+            return True
+
+        if path.exists():
+            self._existing_dirs.add(path)
+            return True
+
+        return False
+
     def _setup(self, app) -> None:
         """Initialize handler by loading required mapping files."""
         super()._setup(app)
@@ -79,6 +242,39 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
         self.osv_timestamp_ids = _load_json_file(self.osv_timestamp_ids_path, app.log)
         self.timestamp_commit_ids = _load_json_file(self.timestamp_commit_ids_path, app.log)
 
+        # make sure pending mapping updates are written before exiting
+        atexit.register(self._flush_mappings)
+
+    def _set_mapping(self, mapping: dict, mapping_path: Path, key: str, value):
+        """Update a mapping in memory and schedule it to be written to disk."""
+        with self._mappings_lock:
+            mapping[key] = value
+            self._dirty_mappings[mapping_path] = mapping
+
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(MAPPINGS_FLUSH_DELAY, self._flush_mappings)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_mappings(self) -> bool:
+        """Write the updated mappings to their files, the ones that fail stay pending for the next flush."""
+        success = True
+
+        with self._mappings_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            for mapping_path, mapping in list(self._dirty_mappings.items()):
+                try:
+                    _write_file_atomic(mapping_path, orjson.dumps(mapping, option=orjson.OPT_INDENT_2))
+                    del self._dirty_mappings[mapping_path]
+                except Exception as e:
+                    self.app.log.error(f"Error updating mappings file {mapping_path}: {str(e)}")
+                    success = False
+
+        return success
+
     def get_osv_record(self, osv_id: str) -> Optional[OSV]:
         """
         Get an OSV record by ID. First checks if the record exists locally,
@@ -90,31 +286,41 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
         Returns:
             OSV: The vulnerability record.
         """
+        osv_record = _lru_get(self._osv_records, self._cache_lock, osv_id)
+
+        if osv_record:
+            return osv_record
+
         try:
             record_path = self.records_path / f"{osv_id}.json"
+            content = record_path.read_bytes()
 
-            if record_path.exists():
-                self.app.log.info(f"Loading vulnerability {osv_id} from local storage")
+            self.app.log.info(f"Loading vulnerability {osv_id} from local storage")
 
-                with record_path.open(mode='r') as f:
-                    json_dict = json.load(f)
+            osv_record = OSV.model_validate_json(content)
+            _lru_put(self._osv_records, self._cache_lock, osv_id, osv_record)
 
-                return OSV(**json_dict)
+            return osv_record
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.app.log.error(f"Error loading vulnerability {osv_id} from local storage: {str(e)}")
 
         return None
 
-    def save_osv_record(self, osv: OSV) -> Optional[Path]:
+    def save_osv_record(self, osv: OSV, content: Optional[bytes] = None) -> Optional[Path]:
         try:
             record_path = self.records_path / f"{osv.id}.json"
 
             self.app.log.info(f"Saving vulnerability {osv.id} to local storage")
 
-            with record_path.open(mode='w') as f:
-                # Now serialize to JSON and save
-                osv_data = osv.model_dump_json(indent=4)
-                f.write(osv_data)
+            if content is not None:
+                # store the original document, it loads back exactly as it was fetched
+                _write_file_atomic(record_path, content)
+            else:
+                _write_file_atomic(record_path, _dump_model(osv, indent=4))
+
+            _lru_put(self._osv_records, self._cache_lock, osv.id, osv)
 
             return record_path
         except Exception as e:
@@ -144,81 +350,72 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
 
         return None
 
-    def set_issue_id(self, osv_id: str, issue_id: int) -> bool:
+    def set_issue_id(self, osv_id: str, issue_id: int) -> None:
         """
-        Setter for the mappings dictionary. Updates the mappings dictionary and saves it to the file.
+        Setter for the mappings dictionary. Updates the mappings dictionary and schedules it to be saved to the file.
+        The file is written later (after MAPPINGS_FLUSH_DELAY seconds or at exit), write errors are only logged.
 
         Args:
             osv_id (str): The OSV ID to map.
             issue_id (str): The issue ID to map to.
         """
-        self.osv_issue_ids[osv_id] = issue_id
+        self._set_mapping(self.osv_issue_ids, self.osv_issue_ids_path, osv_id, issue_id)
+        self.app.log.info(f"Updated mappings with {osv_id} -> {issue_id}")
 
-        try:
-            # Save the updated mappings
-            with self.osv_issue_ids_path.open('w') as f:
-                json.dump(self.osv_issue_ids, f, indent=4)
-
-            self.app.log.info(f"Updated mappings with {osv_id} -> {issue_id}")
-
-            return True
-        except Exception as e:
-            self.app.log.warning(f"Error updating mappings file: {str(e)}")
+    def set_osv_timestamp(self, osv_id: str, timestamp: str) -> None:
+        self._set_mapping(self.osv_timestamp_ids, self.osv_timestamp_ids_path, osv_id, timestamp)
+        self.app.log.info(f"Updated mappings with {osv_id} -> {timestamp}")
 
-        return False
-
-    def set_osv_timestamp(self, osv_id: str, timestamp: str) -> bool:
-        self.osv_timestamp_ids[osv_id] = timestamp
-
-        try:
-            with self.osv_timestamp_ids_path.open('w') as f:
-                json.dump(self.osv_timestamp_ids, f, indent=4)
+    def set_oss_fuzz_repo_sha(self, timestamp: str, oss_fuzz_repo_sha: str) -> None:
+        self._set_mapping(self.timestamp_commit_ids, self.timestamp_commit_ids_path, timestamp, oss_fuzz_repo_sha)
+        self.app.log.info(f"Updated mappings with {timestamp} -> {oss_fuzz_repo_sha}")
 
-            self.app.log.info(f"Updated mappings with {osv_id} -> {timestamp}")
-            return True
-        except Exception as e:
-            self.app.log.warning(f"Error updating mappings file: {str(e)}")
+    def load_issue_report(self, issue_id: int) -> Optional[OSSFuzzIssueReport]:
+        with self._cache_lock:
+            issue_report = self._issue_reports.get(issue_id)
 
-        return False
+        if issue_report:
+            return issue_report
 
-    def set_oss_fuzz_repo_sha(self, timestamp: str, oss_fuzz_repo_sha: str) -> bool:
-        self.timestamp_commit_ids[timestamp] = oss_fuzz_repo_sha
+        issue_report_path = self.issues_path / f"{issue_id}.json"
+        issue_report = _load_model_file(issue_report_path, OSSFuzzIssueReport, self.app.log)
 
-        try:
-            # Save the updated mappings
-            with self.timestamp_commit_ids_path.open('w') as f:
-                json.dump(self.timestamp_commit_ids, f, indent=4)
+        if issue_report:
+            with self._cache_lock:
+                self._issue_reports[issue_id] = issue_report
 
-            self.app.log.info(f"Updated mappings with {timestamp} -> {oss_fuzz_repo_sha}")
-            return True
-        except Exception as e:
-            self.app.log.warning(f"Error updating mappings file: {str(e)}")
+        return issue_report
 
-        return False
+    def load_issue_report_validators(self, issue_id: int) -> Optional[Dict[str, str]]:
+        validators_path = self.issues_path / f"{issue_id}.headers.json"
 
-    def load_issue_report(self, issue_id: int) -> Optional[OSSFuzzIssueReport]:
-        issue_report_path = self.issues_path / f"{issue_id}.json"
+        return _load_sidecar_file(validators_path, self.app.log) or None
 
-        if issue_report_path.exists():
-            oss_fuzz_issue_report_dict = _load_json_file(issue_report_path, self.app.log)
+    def save_issue_report(self, issue_report: OSSFuzzIssueReport, validators: Optional[Dict[str, str]] = None) -> Path:
+        issue_report_path = self.issues_path / f"{issue_report.id}.json"
 
-            if oss_fuzz_issue_report_dict:
-                return OSSFuzzIssueReport(**oss_fuzz_issue_report_dict)
+        _write_file_atomic(issue_report_path, _dump_model(issue_report, indent=4))
 
-        return None
+        # sidecar with the response validators, used to revalidate the cached report
+        validators_path = self.issues_path / f"{issue_report.id}.headers.json"
 
-    def save_issue_report(self, issue_report: OSSFuzzIssueReport) -> Path:
-        issue_report_path = self.issues_path / f"{issue_report.id}.json"
+        if validators:
+            _write_file_atomic(validators_path, orjson.dumps(validators))
+        else:
+            # the validators of a previous response do not apply to this report
+            validators_path.unlink(missing_ok=True)
 
-        with issue_report_path.open(mode="w") as f:
-            oss_fuzz_issue_report_json = issue_report.model_dump_json(indent=4)
-            f.write(oss_fuzz_issue_report_json)
+        with self._cache_lock:
+            self._issue_reports[issue_report.id] = issue_report
 
         return issue_report_path
 
-    def get_testcase_path(self, testcase_id: int) -> Optional[Path]:
+    def get_testcase_path(self, testcase_id: int, check: bool = True) -> Optional[Path]:
         testcase_path = self.testcases_path / str(testcase_id)
 
+        if not check:
+            return testcase_path
+
         # Check if the file already exists
         if testcase_path.exists():
             self.app.log.info(f"Test case file already exists at {testcase_path}")
@@ -230,7 +427,7 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
         output_path = self.outputs_path / mode / osv_id
 
         if mkdir:
-            output_path.mkdir(parents=True, exist_ok=True)
+            self._make_dir(output_path)
 
         if file_name:
             output_file = output_path / file_name
@@ -245,8 +442,7 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
     def save_testcase(self, testcase_id: int, content: bytes) -> Optional[Path]:
         testcase_path = self.testcases_path / str(testcase_id)
         try:
-            with testcase_path.open(mode='wb') as f:
-                f.write(content) # type: ignore[arg-type]
+            testcase_path.write_bytes(content)
 
             self.app.log.info(f"Test case saved to {testcase_path}")
             return testcase_path
@@ -257,52 +453,79 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
     def load_context(self, osv_id: str, mode: ReproductionMode) -> Optional[ReproductionContext]:
         context_path = self.context_path / f"{osv_id}-{mode.value}.json"
 
-        if context_path.exists():
-            context_dict = _load_json_file(context_path, self.app.log)
-
-            if context_dict:
-                return ReproductionContext(**context_dict)
-
-        return None
+        return _load_model_file(context_path, ReproductionContext, self.app.log)
 
     def save_context(self, context: ReproductionContext) -> Path:
         context_path = self.context_path / f"{context.id}-{context.mode.value}.json"
 
-        with context_path.open(mode="w") as f:
-            json_str = context.model_dump_json(indent=4, exclude_unset=True, exclude_none=True)
-            f.write(json_str)
+        _write_file_atomic(context_path, _dump_model(context, indent=4, exclude_unset=True, exclude_none=True))
 
         return context_path
 
     def load_snapshot(self, project_name: str, sanitizer: str, timestamp: str) -> Optional[dict]:
+        key = (project_name, sanitizer, timestamp)
+
+        with self._cache_lock:
+            snapshot = self._snapshots.get(key)
+
+        if snapshot:
+            return snapshot
+
         snapshot_file_path = self.snapshots_path / f"{project_name}-{sanitizer}-{timestamp}.json"
 
         if snapshot_file_path.exists():
             self.app.log.info(f"Using cached snapshot from {snapshot_file_path}")
+            snapshot = _load_json_file_mmap(snapshot_file_path, self.app.log)
+
+            if snapshot:
+                with self._cache_lock:
+                    self._snapshots[key] = snapshot
 
-            return _load_json_file(snapshot_file_path, self.app.log)
+            return snapshot
 
         return None
 
-    def save_snapshot(self, srcmap: dict, project_name: str, sanitizer: str, timestamp: str) -> Path:
+    def load_snapshot_generation(self, project_name: str, sanitizer: str, timestamp: str) -> Optional[int]:
+        meta_file_path = self.snapshots_path / f"{project_name}-{sanitizer}-{timestamp}.meta"
+        meta = _load_sidecar_file(meta_file_path, self.app.log)
+
+        return meta.get("generation") if isinstance(meta, dict) else None
+
+    def save_snapshot(
+            self, srcmap: dict, project_name: str, sanitizer: str, timestamp: str, generation: Optional[int] = None
+    ) -> Path:
+        # the snapshots directory is created in _init_paths
         snapshot_file_path = self.snapshots_path / f"{project_name}-{sanitizer}-{timestamp}.json"
-        snapshot_file_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_file_atomic(snapshot_file_path, orjson.dumps(srcmap, option=orjson.OPT_INDENT_2))
 
-        with snapshot_file_path.open(mode="w") as f:
-            json.dump(srcmap, f, indent=2)
+        # sidecar with the blob generation, used to revalidate the cached copy
+        meta_file_path = snapshot_file_path.with_suffix(".meta")
+
+        if generation is not None:
+            _write_file_atomic(meta_file_path, orjson.dumps({"generation": generation}))
+        else:
+            # the generation of a previous download does not apply to this copy
+            meta_file_path.unlink(missing_ok=True)
+
+        with self._cache_lock:
+            self._snapshots[(project_name, sanitizer, timestamp)] = srcmap
 
         return snapshot_file_path
 
     def load_project_info(self, project_name: str, oss_fuzz_repo_sha: str) -> Optional[ProjectInfo]:
-        try:
-            project_info_path = self.projects_path / project_name / oss_fuzz_repo_sha / "project.json"
+        project_info = _lru_get(self._project_infos, self._cache_lock, (project_name, oss_fuzz_repo_sha))
+
+        if project_info:
+            return project_info
 
-            if project_info_path.exists():
-                project_info_dict = _load_json_file(project_info_path, self.app.log)
+        try:
+            project_info_path = self._project_path(project_name, oss_fuzz_repo_sha) / "project.json"
+            project_info = _load_model_file(project_info_path, ProjectInfo, self.app.log)
 
-                if project_info_dict:
-                    return ProjectInfo(**project_info_dict)
+            if project_info:
+                _lru_put(self._project_infos, self._cache_lock, (project_name, oss_fuzz_repo_sha), project_info)
 
+            return project_info
         except Exception as e:
             self.app.log.error(f"Error loading project info: {e}")
 
@@ -310,62 +533,82 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
 
     def save_project_info(self, project_info: ProjectInfo) -> Optional[Path]:
         try:
-            project_info_path = self.projects_path / project_info.name / project_info.oss_fuzz_repo_sha / "project.json"
-            project_info_path.parent.mkdir(parents=True, exist_ok=True)
+            project_path = self._make_project_path(project_info.name, project_info.oss_fuzz_repo_sha)
+            project_info_path = project_path / "project.json"
+
+            _write_file_atomic(project_info_path, _dump_model(project_info, indent=4))
 
-            with project_info_path.open(mode="w") as f:
-                project_info_json_str = project_info.model_dump_json(indent=4)
-                f.write(project_info_json_str)
+            _lru_put(self._project_infos, self._cache_lock, (project_info.name, project_info.oss_fuzz_repo_sha), project_info)
 
-                return project_info_path
+            return project_info_path
         except Exception as e:
             self.app.log.error(f"Error saving project info: {e}")
 
         return None
 
     def get_project_files(self, name: str, oss_fuzz_repo_sha: str) -> Optional[Dict[str, bytes]]:
-        project_files_path = self.projects_path / name / oss_fuzz_repo_sha
-
-        if not project_files_path.exists():
-            return None
-
+        project_files_path = self._project_path(name, oss_fuzz_repo_sha)
         results = {}
 
-        for file in project_files_path.iterdir():
-            if file.name == "project.json":
-                continue
-
-            if file.is_file():
-                results[file.name] = file.read_bytes()
+        try:
+            # scandir entries carry the file type, sparing a stat per file
+            with os.scandir(project_files_path) as entries:
+                for entry in entries:
+                    if entry.name == "project.json":
+                        continue
+
+                    if entry.is_file():
+                        with open(entry.path, "rb") as f:
+                            results[entry.name] = f.read()
+        except FileNotFoundError:
+            return None
 
         return results
 
     def get_project_path(self, project_name: str, oss_fuzz_repo_sha: str) -> Optional[Path]:
-        project_path = self.projects_path / project_name / oss_fuzz_repo_sha
+        project_path = self._project_path(project_name, oss_fuzz_repo_sha)
 
-        if project_path.exists():
+        if self._dir_exists(project_path):
             return project_path
 
         return None
 
+    def _list_project_file_names(self, project_path: Path) -> frozenset:
+        file_names = self._project_file_names.get(project_path)
+
+        if file_names is None:
+            try:
+                with os.scandir(project_path) as entries:
+                    file_names = frozenset(entry.name for entry in entries if entry.is_file())
+            except FileNotFoundError:
+                # not cached, the files may still be saved later
+                return frozenset()
+
+            self._project_file_names[project_path] = file_names
+
+        return file_names
+
     def get_project_file_path(self, project_name: str, oss_fuzz_repo_sha: str, file_name: str) -> Optional[Path]:
-        project_files_path = self.projects_path / project_name / oss_fuzz_repo_sha / file_name
+        project_path = self._project_path(project_name, oss_fuzz_repo_sha)
+
+        if "/" in file_name:
+            # nested paths are not part of the listing
+            project_file_path = project_path / file_name
+            return project_file_path if project_file_path.exists() else None
 
-        if project_files_path.exists():
-            return project_files_path
+        if file_name in self._list_project_file_names(project_path):
+            return project_path / file_name
 
         return None
 
     def save_project_files(self, name: str, oss_fuzz_repo_sha: str, project_files: Dict[str, bytes]) -> bool:
-        project_files_path = self.projects_path / name / oss_fuzz_repo_sha
-        project_files_path.mkdir(parents=True, exist_ok=True)
+        project_files_path = self._make_project_path(name, oss_fuzz_repo_sha)
+        # the directory listing is stale once files are written
+        self._project_file_names.pop(project_files_path, None)
 
         try:
             for file_name, file_content in project_files.items():
-                project_file_path = project_files_path / file_name
-
-                with project_file_path.open(mode="wb") as f:
-                    f.write(file_content) # type: ignore[arg-type]
+                (project_files_path / file_name).write_bytes(file_content)
             return True
         except Exception as e:
             self.app.log.error(f"Error saving project files: {e}")
@@ -378,7 +621,7 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
         if not check:
             return repo_path
 
-        if repo_path.exists():
+        if self._dir_exists(repo_path):
             return repo_path
 
         return None
@@ -386,31 +629,23 @@ class FileProvisionHandler(FileProvisionInterface, HandlersInterface, Handler):
     def load_crash_info(self, osv_id: str, mode: str) -> Optional[CrashInfo]:
         crash_info_file = self.outputs_path / mode / osv_id / "crash_info.json"
 
-        if crash_info_file.exists():
-            crash_info_dict = _load_json_file(crash_info_file, self.app.log)
-
-            if crash_info_dict:
-                return CrashInfo(**crash_info_dict)
-
-        return None
+        return _load_model_file(crash_info_file, CrashInfo, self.app.log)
 
     def save_crash_info(self, osv_id: str, mode: str, crash_info: CrashInfo) -> Optional[Path]:
         crash_info_file = self.outputs_path / mode / osv_id / "crash_info.json"
 
-        with crash_info_file.open(mode="w") as f:
-            crash_info_json_str = crash_info.model_dump_json(indent=4)
-            f.write(crash_info_json_str)
+        _write_file_atomic(crash_info_file, _dump_model(crash_info, indent=4))
 
         return crash_info_file
 
     def load_runner_logs(self, osv_id: str, mode: str) -> Optional[List[str]]:
         log_file = self.outputs_path / mode / osv_id / "runner.log"
 
-        if log_file.exists():
+        try:
             with log_file.open(mode="r") as f:
                 return f.readlines()
-
-        return None
+        except FileNotFoundError:
+            return None
 
     def save_runner_logs(self, osv_id: str, mode: str, logs: List[str]):
         log_file = self.outputs_path / mode / osv_id / "runner.log"
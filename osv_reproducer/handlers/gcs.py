@@ -1,15 +1,26 @@
-import json
+import orjson
+import threading
 
 from cement import Handler
 from datetime import datetime
-from google.cloud import storage
-from typing import Optional, Tuple, Union
+from requests.adapters import HTTPAdapter
+from typing import Optional, Tuple, Union, Iterator, TYPE_CHECKING
+from google.api_core.exceptions import NotModified
 from google.cloud.exceptions import GoogleCloudError, NotFound
 
 from ..core.exc import GCSError
 from ..handlers import HandlersInterface
 from ..core.interfaces import GCSInterface
 
+if TYPE_CHECKING:
+    from google.cloud import storage
+
+
+# Default download chunk size (must be a multiple of 256 KiB)
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+# Size of the HTTP connection pool shared by the GCS client
+HTTP_POOL_SIZE = 32
+
 
 # --- Normalize timestamp inputs ---
 def ts_to_str(ts):
@@ -26,38 +37,61 @@ class GCSHandler(GCSInterface, HandlersInterface, Handler):
     class Meta:
         label = "gcs"
 
+    # anonymous client shared by all handler instances
+    _gcs_client: Optional["storage.Client"] = None
+    _gcs_client_lock = threading.Lock()
+
+    @classmethod
+    def _get_client(cls) -> "storage.Client":
+        with cls._gcs_client_lock:
+            if cls._gcs_client is None:
+                # the storage client library is slow to import, only load it when the handler is set up
+                from google.cloud import storage
+
+                client = storage.Client.create_anonymous_client()
+                # allow concurrent downloads without serializing on connection acquisition
+                client._http.mount("https://", HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE))
+                cls._gcs_client = client
+
+        return cls._gcs_client
+
     def _setup(self, app):
         super()._setup(app)
         self.config = self.app.config.get("handlers", "gcs")
-        self.gcs_client = storage.Client.create_anonymous_client()
+        self.chunk_size = self.config.get("chunk_size", DEFAULT_CHUNK_SIZE)
+        self.gcs_client = self._get_client()
         self.app.log.info("GCS client initialized successfully")
 
-    def fetch_file_content(self, bucket_name: str, source_blob_name: str) -> bytes:
+    def fetch_file_content(self, bucket_name: str, source_blob_name: str, missing_ok: bool = False) -> Optional[bytes]:
         """
         Download a file from a GCS bucket.
 
         Args:
             bucket_name: Name of the GCS bucket.
             source_blob_name: Name of the blob to download.
+            missing_ok: Return None instead of raising when the blob does not exist.
 
         Returns:
-            bytes: file content as bytes.
+            bytes: file content as bytes, or None if the file is missing and missing_ok is set.
 
         Raises:
             GCSError: If downloading the file fails.
         """
         try:
-            self.app.log.info(f"Downloading file {source_blob_name} from bucket {bucket_name}")
+            self.app.log.debug(f"Downloading file {source_blob_name} from bucket {bucket_name}")
 
             # Get the bucket and blob
             bucket = self.gcs_client.bucket(bucket_name)
-            blob = bucket.blob(source_blob_name)
+            blob = bucket.blob(source_blob_name, chunk_size=self.chunk_size)
 
             # Return the file content as bytes
             content = blob.download_as_bytes()
-            self.app.log.info(f"Successfully downloaded content of {source_blob_name} from bucket {bucket_name}")
+            self.app.log.debug(f"Successfully downloaded content of {source_blob_name} from bucket {bucket_name}")
             return content
         except NotFound as e:
+            if missing_ok:
+                return None
+
             self.app.log.error(f"File {source_blob_name} not found in bucket {bucket_name}: {str(e)}")
             raise GCSError(f"File {source_blob_name} not found in bucket {bucket_name}: {str(e)}")
         except GoogleCloudError as e:
@@ -82,14 +116,14 @@ class GCSHandler(GCSInterface, HandlersInterface, Handler):
             GCSError: If checking file existence fails.
         """
         try:
-            self.app.log.info(f"Checking if file {blob_name} exists in bucket {bucket_name}")
+            self.app.log.debug(f"Checking if file {blob_name} exists in bucket {bucket_name}")
 
             # Check if file exists
             bucket = self.gcs_client.bucket(bucket_name)
             blob = bucket.blob(blob_name)
             exists = blob.exists()
 
-            self.app.log.info(f"File {blob_name} {'exists' if exists else 'does not exist'} in bucket {bucket_name}")
+            self.app.log.debug(f"File {blob_name} {'exists' if exists else 'does not exist'} in bucket {bucket_name}")
             return exists
         except NotFound:
             self.app.log.info(f"Bucket {bucket_name} not found")
@@ -101,37 +135,37 @@ class GCSHandler(GCSInterface, HandlersInterface, Handler):
             self.app.log.error(f"Error while checking if file {blob_name} exists: {str(e)}")
             raise GCSError(f"Failed to check if file {blob_name} exists: {str(e)}")
 
-    def list_blobs_with_prefix(self, bucket_name: str, prefix: str, start_offset: Optional[str] = None) -> list:
+    def list_blobs_with_prefix(
+            self, bucket_name: str, prefix: str, start_offset: Optional[str] = None
+    ) -> Iterator[str]:
         """
-        List blobs in a bucket with a specific prefix.
+        Lazily list blobs in a bucket with a specific prefix, in lexicographic order.
 
         Args:
             bucket_name: Name of the GCS bucket.
             prefix: Prefix used to filter blobs.
             start_offset: Filter results to objects whose names are lexicographically equal to or after this value.
 
-        Returns:
-            list: List of blob names.
+        Yields:
+            str: Blob names, as pages are fetched from the API.
 
         Raises:
             GCSError: If listing blobs fails.
         """
         try:
-            self.app.log.info(f"Listing blobs with prefix {prefix} in bucket {bucket_name}")
+            self.app.log.debug(f"Listing blobs with prefix {prefix} in bucket {bucket_name}")
 
-            # List blobs
+            # List blobs (the API already returns them in lexicographic order)
             bucket = self.gcs_client.bucket(bucket_name)
-            blobs = bucket.list_blobs(prefix=prefix, start_offset=start_offset)
+            count = 0
 
-            # Convert to list and sort
-            blob_names = [blob.name for blob in blobs]
-            blob_names.sort()
+            for blob in bucket.list_blobs(prefix=prefix, start_offset=start_offset):
+                count += 1
+                yield blob.name
 
-            self.app.log.info(f"Found {len(blob_names)} blobs with prefix {prefix} in bucket {bucket_name}")
-            return blob_names
+            self.app.log.debug(f"Found {count} blobs with prefix {prefix} in bucket {bucket_name}")
         except NotFound:
             self.app.log.info(f"Bucket {bucket_name} not found")
-            return []
         except GoogleCloudError as e:
             self.app.log.error(f"Google Cloud error while listing blobs with prefix {prefix}: {str(e)}")
             raise GCSError(f"Failed to list blobs with prefix {prefix}: {str(e)}")
@@ -151,26 +185,49 @@ class GCSHandler(GCSInterface, HandlersInterface, Handler):
         Returns:
             dict or None: Parsed srcmap, or None if the file does not exist.
         """
+        srcmap, _ = self.fetch_snapshot_if_modified(project_name, sanitizer, timestamp)
+        return srcmap
+
+    def fetch_snapshot_if_modified(
+            self, project_name: str, sanitizer: str, timestamp: str, generation: Optional[int] = None
+    ) -> Tuple[Optional[dict], Optional[int]]:
+        """
+        Fetch the snapshot for the exact timestamp, unless its blob generation still matches the given one.
+
+        Args:
+            project_name: OSS-Fuzz project name.
+            sanitizer: Sanitizer name.
+            timestamp: Timestamp "YYYYMMDDHHMM".
+            generation: Generation of a previously downloaded copy. When it still matches, the body is not
+                transferred.
+
+        Returns:
+            (srcmap, generation) tuple. srcmap is None when the blob is unchanged (the given generation is
+            returned) or when it could not be fetched (generation is None as well).
+        """
+        blob_name = f"{project_name}/{project_name}-{sanitizer}-{timestamp}.srcmap.json"
+
         try:
-            # Construct exact filename
-            blob_name = f"{project_name}/{project_name}-{sanitizer}-{timestamp}.srcmap.json"
+            bucket = self.gcs_client.bucket(self.config["bucket_name"])
+            blob = bucket.blob(blob_name, chunk_size=self.chunk_size)
 
-            # Exact file check
-            if not self.file_exists(self.config["bucket_name"], blob_name):
-                self.app.log.warning(f"Snapshot not found for project {project_name} at timestamp {timestamp}")
-                return None
+            # Download & parse in a single request; the generation comes back in the response headers
+            content = blob.download_as_bytes(if_generation_not_match=generation)
+            srcmap = orjson.loads(content)
 
-            # Download & parse
-            content = self.fetch_file_content(self.config["bucket_name"], blob_name)
-            srcmap = json.loads(content.decode("utf-8"))
-            return srcmap
+            return srcmap, int(blob.generation) if blob.generation else None
 
-        except GCSError as ge:
+        except NotModified:
+            self.app.log.debug(f"Snapshot {blob_name} unchanged (generation={generation})")
+            return None, generation
+        except NotFound:
+            self.app.log.warning(f"Snapshot not found for project {project_name} at timestamp {timestamp}")
+        except GoogleCloudError as ge:
             self.app.log.error(f"Error downloading srcmap for project {project_name} at {timestamp}: {ge}")
         except Exception as e:
             self.app.log.error(f"Error downloading srcmap for project {project_name} at {timestamp}: {e}")
 
-        return None
+        return None, None
 
     def fetch_snapshot_by_range(
             self, project_name: str,  sanitizer: str, start_timestamp: Union[str, datetime], end_timestamp: Union[str, datetime]
@@ -213,24 +270,17 @@ class GCSHandler(GCSInterface, HandlersInterface, Handler):
 
             self.app.log.info(f"Searching snapshot range for {project_name}:{sanitizer} {start_ts_str} → {end_ts_str}")
 
-            # --- List blobs ---
-            blob_names = self.list_blobs_with_prefix(self.config["bucket_name"], prefix)
-
-            if not blob_names:
-                self.app.log.info(f"No snapshots found for prefix {prefix}")
-                return None, None
-
-            # --- Build filtered list (timestamp extracted from file name) ---
+            # --- Build filtered list while streaming blob names (timestamp extracted from file name) ---
             candidates = []
 
-            for blob_name in blob_names:
+            for blob_name in self.list_blobs_with_prefix(self.config["bucket_name"], prefix):
                 if not blob_name.endswith(".srcmap.json"):
                     continue
 
-                try:
-                    blob_ts = blob_name.split("-")[-1].replace(".srcmap.json", "")
-                    datetime.strptime(blob_ts, "%Y%m%d%H%M")  # validate
-                except ValueError:
+                blob_ts = blob_name[:-len(".srcmap.json")].rpartition("-")[2]
+
+                # "YYYYMMDDHHMM" timestamps compare lexicographically, so validating the shape is enough
+                if len(blob_ts) != 12 or not blob_ts.isdigit():
                     self.app.log.warning(f"Skipping invalid snapshot name: {blob_name}")
                     continue
 
@@ -242,14 +292,11 @@ class GCSHandler(GCSInterface, HandlersInterface, Handler):
                 self.app.log.info(f"No snapshots in range {start_ts_str} → {end_ts_str}")
                 return None, None
 
-            # --- Sort: newest → oldest ---
-            candidates.sort(key=lambda x: x[1], reverse=True)
-
-            # --- Return the FIRST valid match ---
-            for blob_name, blob_ts in candidates:
+            # --- Return the FIRST valid match; names are listed oldest → newest ---
+            for blob_name, blob_ts in reversed(candidates):
                 try:
                     content = self.fetch_file_content(self.config["bucket_name"], blob_name)
-                    srcmap = json.loads(content.decode("utf-8"))
+                    srcmap = orjson.loads(content)
 
                     self.app.log.info(f"Match found: {blob_name} (timestamp={blob_ts})")
                     return blob_ts, srcmap
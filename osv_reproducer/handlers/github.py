@@ -1,17 +1,23 @@
 import git
+import time
+import base64
 import yaml
+import shutil
+import functools
+import threading
 
 from pathlib import Path
 from cement import Handler
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Dict, Optional, Any, Tuple, List
-from github.GithubException import UnknownObjectException
+from github.GithubException import GithubException
 from github.GithubException import BadCredentialsException
 
 from gitlib import GitClient
 from git import GitCommandError
+from gitlib.common.exceptions import GitLibException
 
-from gitlib.github.commit import GitCommit
 from gitlib.github.repository import GitRepo
 from gitlib.parsers.url.base import GithubUrlParser
 
@@ -20,6 +26,71 @@ from ..handlers import HandlersInterface
 from ..core.interfaces import GithubInterface
 from ..core.models import ProjectInfo, ProjectRange
 
+try:
+    # libyaml bindings, considerably faster than the pure Python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Maximum number of concurrent requests when downloading the files of a project
+PROJECT_FILES_WORKERS = 8
+
+# Lists a directory of a repository along with the text of its files
+TREE_ENTRIES_QUERY = """
+query($owner: String!, $name: String!, $expression: String!) {
+  repository(owner: $owner, name: $name) {
+    object(expression: $expression) {
+      ... on Tree { entries { name type oid object { ... on Blob { text isTruncated } } } }
+    }
+  }
+}
+"""
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_github_url(url: str):
+    """Parse a GitHub repository URL (memoized, projects and snapshots repeat the same URLs)."""
+    return GithubUrlParser(url.replace(".git", ""))()
+
+
+def _read_head_commit(repo_path: Path) -> Optional[str]:
+    """Resolve the HEAD commit of a local clone by reading its .git directory, without loading the repository.
+
+    Args:
+        repo_path: Path to the working tree of the clone
+
+    Returns:
+        The commit SHA, or None if the path is not a clone or HEAD does not point to a commit
+    """
+    git_dir = repo_path / ".git"
+
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    if not head.startswith("ref: "):
+        # detached HEAD
+        return head or None
+
+    ref = head[len("ref: "):]
+    ref_path = git_dir / ref
+
+    if ref_path.exists():
+        return ref_path.read_text().strip() or None
+
+    packed_refs_path = git_dir / "packed-refs"
+
+    if packed_refs_path.exists():
+        for line in packed_refs_path.read_text().splitlines():
+            sha, _, name = line.partition(" ")
+
+            if name == ref:
+                return sha
+
+    return None
+
 
 class GithubHandler(GithubInterface, HandlersInterface, Handler):
     """
@@ -39,6 +110,11 @@ class GithubHandler(GithubInterface, HandlersInterface, Handler):
             self.app.log.warning("No project repo mappings found in config.")
 
         token = self.config.get("token", None)
+
+        # unauthenticated requests are limited to 60 per hour, which is not enough for a single reproduction
+        if not token or token == "<YOUR_TOKEN_HERE>":
+            raise GitHubError("No GitHub token configured. Set handlers.github.token in the configuration file.")
+
         self.client = GitClient(token)
 
         try:
@@ -46,33 +122,59 @@ class GithubHandler(GithubInterface, HandlersInterface, Handler):
         except BadCredentialsException:
             raise GitHubError("Failed to initialize GitHub client. Check your token and try again.")
 
-        self._repo_cache: Dict[str, GitRepo] = {}
-        self._commit_cache: Dict[str, GitCommit] = {}
+        self.app.log.debug(f"GitHub API requests remaining: {remaining}")
+
+        # content-addressed store of fetched files, keyed by git blob SHA
+        self.blob_cache_path = Path(
+            self.config.get("blob_cache_dir", Path.home() / ".osv_reproducer" / "blob_cache")
+        ).expanduser()
+        # blob cache shard directories known to exist
+        self._blob_dirs = set()
+
+        # bounded memoization of successful repository lookups
+        self._get_cached_repo = functools.lru_cache(maxsize=1024)(self._fetch_repo)
+        self._commit_dates: Dict[str, datetime] = {}
         self._not_found = set()
+        # project directory contents (project.yaml included), keyed by (name, oss-fuzz ref)
+        self._project_dirs: Dict[Tuple[str, str], Dict[str, bytes]] = {}
+        # one lock per checkout directory, concurrent contexts may clone the same repository at the same commit
+        self._clone_locks: Dict[Path, threading.Lock] = {}
+        self._clone_locks_lock = threading.Lock()
+
+    def _wait_for_rate_limit(self, required: int):
+        """Sleep until the rate limit resets if the remaining budget cannot cover the required requests."""
+        core = self.client.git_api.get_rate_limit().core
+
+        if core.remaining >= required:
+            return
+
+        reset = core.reset if core.reset.tzinfo else core.reset.replace(tzinfo=timezone.utc)
+        wait = max((reset - datetime.now(timezone.utc)).total_seconds(), 0) + 1
+        self.app.log.warning(
+            f"GitHub rate limit nearly exhausted ({core.remaining} left, {required} needed); waiting {int(wait)}s"
+        )
+        time.sleep(wait)
+
+    def _fetch_repo(self, owner: str, project: str) -> GitRepo:
+        # raises on failure, so lru_cache does not keep transient errors (e.g., rate limit, 5xx) as misses
+        return self.client.get_repo(owner, project, raise_err=True)
+
+    def _get_repo(self, owner: str, project: str) -> Optional[GitRepo]:
+        try:
+            return self._get_cached_repo(owner, project)
+        except GitLibException as e:
+            self.app.log.warning(str(e))
+            return None
 
     def get_fix_date_range(self, project_ranges: List[ProjectRange]) -> Tuple[Optional[datetime], Optional[datetime]]:
         dates: List[datetime] = []
 
-        for project_range in project_ranges:
-            repo_path = str(project_range)
+        # resolve the fix commit dates in a single batched request
+        fix_dates = self.get_commit_dates(
+            [(project_range.owner, project_range.name, project_range.fix_sha) for project_range in project_ranges]
+        )
 
-            if repo_path in self._not_found:
-                continue
-
-            if repo_path not in self._repo_cache:
-                repo = self.client.get_repo(project_range.owner, project_range.name)
-                if repo is None:
-                    # remember as not found so we skip next time
-                    self._not_found.add(repo_path)
-                    continue
-                self._repo_cache[repo_path] = repo
-
-            # resolve the fix commit date
-            fix_date = self.get_commit_date(
-                owner=project_range.owner,
-                project=project_range.name,
-                version=project_range.fix_sha,
-            )
+        for fix_date in fix_dates.values():
             if fix_date is not None:
                 dates.append(fix_date)
 
@@ -85,84 +187,140 @@ class GithubHandler(GithubInterface, HandlersInterface, Handler):
         return start, end
 
     def get_commit_date(self, owner: str, project: str, version: str) -> Optional[datetime]:
-        repo_path = f"{owner}/{project}"
+        commit_id = f"{owner}/{project}@{version}"
 
-        if repo_path in self._not_found:
-            return None
+        # commits are immutable, cached answers do not need the repository
+        if commit_id in self._commit_dates:
+            return self._commit_dates[commit_id]
 
-        if repo_path not in self._repo_cache:
-            repo = self.client.get_repo(owner, project)
+        if commit_id in self._not_found:
+            return None
 
-            if repo is None:
-                self.app.log.error(f"Repository {repo_path} not found.")
-                self._not_found.add(repo_path)
-                return None
+        repo = self._get_repo(owner, project)
 
-            self._repo_cache[repo_path] = repo
+        if repo is None:
+            self.app.log.error(f"Repository {owner}/{project} not found.")
+            return None
 
-        self.app.log.info(f"Getting date for {repo_path}@{version}")
-        commit_id = f"{repo_path}@{version}"
+        self.app.log.info(f"Getting date for {commit_id}")
+        commit = repo.get_commit(version)
 
-        if commit_id in self._not_found:
+        if commit is None:
+            self.app.log.error(f"{commit_id} not found.")
+            self._not_found.add(commit_id)
             return None
 
-        if commit_id not in self._commit_cache:
-            commit = self._repo_cache[repo_path].get_commit(version)
+        self._commit_dates[commit_id] = commit.commit.commit.committer.date
 
-            if commit is None:
-                self.app.log.error(f"{repo_path}@{version} not found.")
-                self._not_found.add(commit_id)
-                return None
+        return self._commit_dates[commit_id]
+
+    def get_commit_dates(self, commits: List[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], Optional[datetime]]:
+        """
+        Resolve the committer dates of several commits with a single GraphQL request.
 
-            self._commit_cache[commit_id] = commit
+        Commits already resolved are served from the cache. If the batched request fails (e.g., one of the
+        repositories or commits does not exist), the remaining commits are resolved individually.
 
-        return self._commit_cache[commit_id].commit.commit.committer.date
+        Args:
+            commits: List of (owner, project, version) tuples.
+
+        Returns:
+            Dictionary mapping each (owner, project, version) tuple to its committer date, or None if not found.
+        """
+        dates = {}
+        pending = []
+
+        for key in dict.fromkeys(commits):
+            commit_id = "{}/{}@{}".format(*key)
+
+            if commit_id in self._commit_dates:
+                dates[key] = self._commit_dates[commit_id]
+            elif commit_id in self._not_found:
+                dates[key] = None
+            else:
+                pending.append(key)
+
+        if not pending:
+            return dates
+
+        variable_defs, fields, variables = [], [], {}
+
+        for i, (owner, project, version) in enumerate(pending):
+            variable_defs.append(f"$o{i}: String!, $n{i}: String!, $e{i}: String!")
+            fields.append(
+                f"c{i}: repository(owner: $o{i}, name: $n{i}) {{ object(expression: $e{i}) {{ ... on Commit {{ committedDate }} }} }}"
+            )
+            variables.update({f"o{i}": owner, f"n{i}": project, f"e{i}": version})
+
+        query = f"query({', '.join(variable_defs)}) {{ {' '.join(fields)} }}"
+
+        try:
+            _, response = self.client.git_api.requester.graphql_query(query, variables)
+            data = response.get("data") or {}
+        except GithubException as e:
+            self.app.log.warning(f"Batched commit lookup failed, falling back to individual requests: {e}")
+            data = {}
+
+        for i, key in enumerate(pending):
+            commit_object = (data.get(f"c{i}") or {}).get("object") or {}
+            committed_date = commit_object.get("committedDate")
+
+            if committed_date:
+                commit_date = datetime.fromisoformat(committed_date.replace("Z", "+00:00"))
+                self._commit_dates["{}/{}@{}".format(*key)] = commit_date
+                dates[key] = commit_date
+            else:
+                dates[key] = self.get_commit_date(*key)
+
+        return dates
 
     def check_repo_url(self, url: str) -> Tuple[Optional[str], Optional[str]]:
-        git_url_parser = GithubUrlParser(url.replace(".git", ""))
-        git_repo_url = git_url_parser()
+        git_repo_url = _parse_github_url(url)
 
         if not git_repo_url:
             self.app.log.error(f"Could not parse GitHub repo URL: {url}")
             return None, None
 
-        repo_path = str(git_repo_url)
-
-        if repo_path in self._not_found:
+        if self._get_repo(git_repo_url.owner, git_repo_url.repo) is None:
             return None, None
 
-        if repo_path not in self._repo_cache:
-            repo = self.client.get_repo(git_repo_url.owner, git_repo_url.repo)
-
-            if repo is None:
-                # remember as not found so we skip next time
-                self._not_found.add(repo_path)
-                return None, None
-
-            self._repo_cache[repo_path] = repo
-
         return git_repo_url.owner, git_repo_url.repo
 
     def clone_repository(self, repo_url: str, commit: str, to_path: Path, shallow: bool = True) -> Optional[Path]:
-        try:
-            repo = git.Repo(to_path)
-            return to_path
-        except git.exc.NoSuchPathError:
-            # self.app.log.warning(f"Repo not found under directory {to_path}, cloning it")
-            to_path.mkdir(parents=True, exist_ok=True)
-        except git.exc.InvalidGitRepositoryError as e:
-            self.app.log.error(f"Invalid git repository at {to_path}: {str(e)}")
-            return None
+        with self._clone_locks_lock:
+            clone_lock = self._clone_locks.setdefault(to_path, threading.Lock())
+
+        # a second clone into the same directory waits, then finds the checkout done
+        with clone_lock:
+            return self._clone_repository(repo_url, commit, to_path, shallow)
+
+    def _clone_repository(self, repo_url: str, commit: str, to_path: Path, shallow: bool) -> Optional[Path]:
+        if to_path.exists():
+            if _read_head_commit(to_path):
+                return to_path
+
+            if (to_path / ".git").exists():
+                # left behind by an interrupted clone (HEAD does not point to a commit yet)
+                self.app.log.warning(f"Incomplete clone under directory {to_path}, cloning it again")
+                shutil.rmtree(to_path)
+            elif any(to_path.iterdir()):
+                self.app.log.error(f"Invalid git repository at {to_path}")
+                return None
+
+        to_path.mkdir(parents=True, exist_ok=True)
 
         try:
             self.app.log.info(f"Cloning repository {repo_url} at commit {commit} to {to_path}")
 
             if shallow:
-                repo = git.Repo.clone_from(repo_url, to_path, no_checkout=True)
+                # fetch only the target commit, without the refs/heads/* a clone would download
+                repo = git.Repo.init(to_path)
+                repo.create_remote("origin", repo_url)
 
                 try:
                     # Try shallow
                     repo.git.fetch("origin", commit, depth=1)
+                    repo.git.checkout("FETCH_HEAD")
                 except GitCommandError as e:
                     msg = e.stderr or str(e)
                     self.app.log.warning(f"Shallow clone failed: {msg}")
@@ -170,10 +328,14 @@ class GithubHandler(GithubInterface, HandlersInterface, Handler):
                     if "dumb http transport does not support shallow capabilities" in msg \
                             or "does not support --depth" in msg:
                         repo.git.fetch("origin")  # full fetch
+                    elif "not our ref" in msg:
+                        # the server rejects unadvertised SHAs, fetch the full history, but file contents
+                        # are only fetched for the checked out commit
+                        repo.git.fetch("origin", filter="blob:none")
                     else:
                         raise
 
-                repo.git.checkout(commit)
+                    repo.git.checkout(commit)
             else:
                 repo = git.Repo.clone_from(repo_url, to_path)
                 repo.git.checkout(commit)
@@ -196,14 +358,12 @@ class GithubHandler(GithubInterface, HandlersInterface, Handler):
             return None, None
 
         try:
-            clean_repo_url = project_info_dict["main_repo"].replace(".git", "")
-            git_url_parser = GithubUrlParser(clean_repo_url)
-            git_repo_url = git_url_parser()
+            git_repo_url = _parse_github_url(project_info_dict["main_repo"])
 
             if not git_repo_url:
                 return None, None
 
-            project_repo = self.client.get_repo(owner=git_repo_url.owner, project=git_repo_url.repo)
+            project_repo = self._get_repo(git_repo_url.owner, git_repo_url.repo)
             repo_path = str(git_repo_url)
 
             return project_repo, repo_path
@@ -245,7 +405,7 @@ class GithubHandler(GithubInterface, HandlersInterface, Handler):
         return ProjectInfo(**project_info)
 
     def find_oss_fuzz_repo_commit(self, until: datetime) -> Optional[str]:
-        oss_fuzz_repo = self.client.get_repo(owner="google", project="oss-fuzz")
+        oss_fuzz_repo = self._get_repo("google", "oss-fuzz")
 
         self.app.log.info(f"Fetching commits before {until}")
         commits = oss_fuzz_repo.repo.get_commits(until=until)
@@ -271,15 +431,16 @@ class GithubHandler(GithubInterface, HandlersInterface, Handler):
         """
 
         self.app.log.info(f"Fetching from GitHub the project info for {name}")
-        oss_fuzz_repo = self.client.get_repo(owner="google", project="oss-fuzz")
 
-        # Fetch project YAML
-        try:
-            project_yaml = oss_fuzz_repo.repo.get_contents(f"projects/{name}/project.yaml", oss_fuzz_repo_sha)
-            project_info_dict = yaml.safe_load(project_yaml.decoded_content)
-        except UnknownObjectException as uoe:
-            self.app.log.error(f"{uoe}")
+        # project.yaml comes with the rest of the project directory, which is fetched once for the build files too
+        project_dir = self._fetch_project_dir(name, oss_fuzz_repo_sha) or {}
+
+        if "project.yaml" not in project_dir:
+            self.app.log.error(f"Could not find project.yaml for {name} at {oss_fuzz_repo_sha}")
             return None
+
+        try:
+            project_info_dict = yaml.load(project_dir["project.yaml"], Loader=SafeLoader)
         except yaml.YAMLError as yaml_error:
             self.app.log.error(f"{yaml_error}")
             return None
@@ -291,20 +452,125 @@ class GithubHandler(GithubInterface, HandlersInterface, Handler):
 
         return project_info
 
-    def fetch_project_files(self, name: str, oss_fuzz_ref: str) -> Optional[Dict[str, bytes]]:
-        """Save project files (build script and Dockerfile)."""
-        oss_fuzz_repo = self.client.get_repo(owner="google", project="oss-fuzz")
-        project_files = {}
+    def _load_blob(self, sha: str) -> Optional[bytes]:
+        blob_path = self.blob_cache_path / sha[:2] / sha
 
         try:
-            for project_file in oss_fuzz_repo.repo.get_contents(f"projects/{name}", oss_fuzz_ref):
-                if project_file.path.endswith("project.yaml"):
-                    continue
+            return blob_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _read_content_file(repo: GitRepo, content_file) -> bytes:
+        """Return the content of a file from a directory listing, through the Blob API when it exceeds 1 MB."""
+        # the contents API omits the content of large files and reports the encoding as "none"
+        if content_file.encoding == "none":
+            return base64.b64decode(repo.repo.get_git_blob(content_file.sha).content)
+
+        return content_file.decoded_content
+
+    def _save_blob(self, sha: str, content: bytes):
+        blob_path = self.blob_cache_path / sha[:2] / sha
+
+        try:
+            if blob_path.parent not in self._blob_dirs:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                self._blob_dirs.add(blob_path.parent)
+
+            blob_path.write_bytes(content)
+        except OSError as e:
+            self.app.log.warning(f"Could not cache blob {sha}: {e}")
+
+    def _fetch_project_dir_batch(self, name: str, oss_fuzz_ref: str) -> Optional[Dict[str, bytes]]:
+        """Fetch the project directory with a single GraphQL request; None if any file is not available as text."""
+        variables = {"owner": "google", "name": "oss-fuzz", "expression": f"{oss_fuzz_ref}:projects/{name}"}
+
+        try:
+            _, response = self.client.git_api.requester.graphql_query(TREE_ENTRIES_QUERY, variables)
+        except GithubException as e:
+            self.app.log.warning(f"Batched project files lookup failed for {name}: {e}")
+            return None
+
+        tree = ((response.get("data") or {}).get("repository") or {}).get("object")
+
+        if not tree:
+            return None
+
+        project_files = {}
 
-                project_files[project_file.name] = project_file.decoded_content
+        for entry in tree.get("entries", []):
+            if entry["type"] != "blob":
+                continue
+
+            blob = entry.get("object") or {}
+
+            # binary or large files are not returned as text
+            if blob.get("text") is None or blob.get("isTruncated"):
+                return None
+
+            project_files[entry["name"]] = blob["text"].encode()
+            self._save_blob(entry["oid"], project_files[entry["name"]])
+
+        return project_files
+
+    def _fetch_project_dir_listing(self, name: str, oss_fuzz_ref: str) -> Dict[str, bytes]:
+        """Fetch the project directory through the REST contents API, one request per file not in the blob cache."""
+        oss_fuzz_repo = self._get_repo("google", "oss-fuzz")
+        project_files = {}
+        listing = []
 
+        for project_file in oss_fuzz_repo.repo.get_contents(f"projects/{name}", oss_fuzz_ref):
+            if project_file.type != "file":
+                continue
+
+            # the listing carries the blob SHA, so unchanged files are served from the blob cache
+            content = self._load_blob(project_file.sha)
+
+            if content is None:
+                listing.append(project_file)
+            else:
+                project_files[project_file.name] = content
+
+        if not listing:
             return project_files
-        except UnknownObjectException as uoe:
-            self.app.log.error(f"{uoe}")
 
-        return None
+        self._wait_for_rate_limit(len(listing))
+
+        # the listing does not include the content, each file costs a request; fetch them concurrently
+        with ThreadPoolExecutor(max_workers=min(PROJECT_FILES_WORKERS, len(listing))) as executor:
+            contents = executor.map(functools.partial(self._read_content_file, oss_fuzz_repo), listing)
+
+            for project_file, content in zip(listing, contents):
+                project_files[project_file.name] = content
+                self._save_blob(project_file.sha, content)
+
+        return project_files
+
+    def _fetch_project_dir(self, name: str, oss_fuzz_ref: str) -> Optional[Dict[str, bytes]]:
+        """Fetch all the files of the project directory (project.yaml included) once per (name, ref)."""
+        key = (name, oss_fuzz_ref)
+
+        if key in self._project_dirs:
+            return self._project_dirs[key]
+
+        project_dir = self._fetch_project_dir_batch(name, oss_fuzz_ref)
+
+        if project_dir is None:
+            try:
+                project_dir = self._fetch_project_dir_listing(name, oss_fuzz_ref)
+            except GithubException as e:
+                self.app.log.error(f"{e}")
+
+        # misses are remembered as well, so project info and files do not repeat the same failed lookups
+        self._project_dirs[key] = project_dir
+
+        return project_dir
+
+    def fetch_project_files(self, name: str, oss_fuzz_ref: str) -> Optional[Dict[str, bytes]]:
+        """Save project files (build script and Dockerfile)."""
+        project_dir = self._fetch_project_dir(name, oss_fuzz_ref)
+
+        if project_dir is None:
+            return None
+
+        return {file_name: content for file_name, content in project_dir.items() if file_name != "project.yaml"}
@@ -1,9 +1,14 @@
 import re
+import shutil
+import functools
 import requests
 
+from pathlib import Path
 from cement import Handler
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
 from pydantic import AnyHttpUrl, HttpUrl
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict
 
 from ..handlers import HandlersInterface
 from ..core.models.report import OSSFuzzIssueReport
@@ -12,6 +17,16 @@ from ..utils.parse.report import parse_oss_fuzz_report_to_dict
 from ..common.constants import USER_AGENT_HEADERS, HTTP_HEADERS
 
 
+# Size of the HTTP connection pool shared by the handler requests
+HTTP_POOL_SIZE = 16
+# Buffer size used when streaming test cases to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 18
+# Redirect target embedded in the Chromium issue tracker pages
+REDIRECT_URL_RE = re.compile(rb'const\s+url\s*=\s*"([^"]+)"', re.ASCII)
+# Boundaries of the report embedded in the issue page
+DETAILED_REPORT_RE = re.compile(rb"Detailed [Rr]eport:")
+REPORT_END_MARKER = b"Issue filed automatically."
+
 class OSSFuzzHandler(OSSFuzzInterface, HandlersInterface, Handler):
     class Meta:
         label = "oss_fuzz"
@@ -20,68 +35,130 @@ class OSSFuzzHandler(OSSFuzzInterface, HandlersInterface, Handler):
         super()._setup(app)
         self.base_url = HttpUrl("https://issues.oss-fuzz.com")
         self.old_base_url = HttpUrl("https://bugs.chromium.org")
-
-    @property
+        # Chromium issue URLs already resolved to their OSS-Fuzz issue
+        self._resolved_issue_urls: Dict[str, Tuple[str, int]] = {}
+
+        # keep-alive session, so consecutive requests reuse the TCP/TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(USER_AGENT_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=5, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @functools.cached_property
     def action_issues_url(self) -> HttpUrl:
-        return HttpUrl(f"{self.base_url}/action/issues")
+        return HttpUrl(f"{str(self.base_url).rstrip('/')}/action/issues")
 
-    def fetch_test_case_content(self, url: AnyHttpUrl) -> Optional[bytes]:
+    def fetch_test_case(self, url: AnyHttpUrl, to_path: Path) -> Optional[Path]:
         """
-        Retrieves the content of a test case from a URL without saving it.
+        Downloads a test case from a URL, streaming its content directly to a file.
 
         Args:
             url (AnyHttpUrl): The URL to download the test case from.
+            to_path (Path): The file to write the test case to.
 
         Returns:
-            Optional[bytes]: The content of the test case, or None if the download failed.
+            Optional[Path]: The path of the saved test case, or None if the download failed.
         """
+        # write to a temporary file, so an interrupted download is not mistaken for a cached test case
+        part_path = to_path.with_name(f"{to_path.name}.part")
+
         try:
             self.app.log.info(f"Downloading test case content from {url}")
-            response = requests.get(str(url), headers=USER_AGENT_HEADERS, stream=True)
 
-            if response.status_code != 200:
-                self.app.log.warning(f"Failed to download test case: HTTP {response.status_code}")
-                return None
+            with self.session.get(str(url), stream=True) as response:
+                if response.status_code != 200:
+                    self.app.log.warning(f"Failed to download test case: HTTP {response.status_code}")
+                    return None
+
+                response.raw.decode_content = True
+                to_path.parent.mkdir(parents=True, exist_ok=True)
+
+                with part_path.open(mode="wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
 
-            # Return the content as bytes
-            return response.content
+            part_path.replace(to_path)
+            self.app.log.info(f"Test case saved to {to_path}")
+
+            return to_path
 
         except Exception as e:
             self.app.log.error(f"Error downloading test case content: {str(e)}")
+            part_path.unlink(missing_ok=True)
             return None
 
     def fetch_issue_report(self, issue_id: int) -> Optional[OSSFuzzIssueReport]:
+        issue_report, _ = self.fetch_issue_report_if_modified(issue_id)
+        return issue_report
+
+    def fetch_issue_report_if_modified(
+            self, issue_id: int, validators: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[OSSFuzzIssueReport], Optional[Dict[str, str]]]:
+        """
+        Fetches the OSS-Fuzz bug report, unless the page did not change since the given validators were issued.
+
+        Args:
+            issue_id (int): The issue ID.
+            validators (Optional[Dict[str, str]]): The ETag and Last-Modified headers of a previous response.
+
+        Returns:
+            Tuple of the issue report and the validators of the response. The issue report is None when the page
+            is unchanged (the given validators are returned) or when it could not be fetched (validators are None).
+        """
+        headers = {}
+
+        if validators:
+            if validators.get("ETag"):
+                headers["If-None-Match"] = validators["ETag"]
+            if validators.get("Last-Modified"):
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+
         try:
             self.app.log.info(f"Fetching OSS-Fuzz bug report from {self.action_issues_url}/{issue_id}")
-            response = requests.get(f"{self.action_issues_url}/{issue_id}", headers=USER_AGENT_HEADERS)
+            response = self.session.get(f"{self.action_issues_url}/{issue_id}", headers=headers)
+
+            if response.status_code == 304:
+                self.app.log.info(f"OSS-Fuzz bug report {issue_id} not modified")
+                return None, validators
 
             if response.status_code != 200:
                 self.app.log.warning(f"Failed to fetch bug report: HTTP {response.status_code}")
-                return None
+                return None, None
 
-            decoded = response.text.encode('utf-8').decode('unicode_escape')
-            decoded = decoded.replace("Detailed report:", "Detailed Report:")
-            data_clean = decoded.split("Detailed Report:")
+            # locate the report in the raw page and only unescape that span
+            content = response.content
+            start = DETAILED_REPORT_RE.search(content)
 
-            if len(data_clean) < 2:
+            if not start:
                 self.app.log.warning(f"issue content not split by 'Detailed Report:'")
-                return None
+                return None, None
 
-            data_clean = data_clean[1].split("Issue filed automatically.")
+            following = DETAILED_REPORT_RE.search(content, start.end())
+            section = content[start.end():following.start() if following else len(content)]
 
-            if len(data_clean) != 2:
+            if section.count(REPORT_END_MARKER) != 1:
                 self.app.log.warning(f"issue content not split by 'Issue filed automatically.'")
-                return None
+                return None, None
 
-            report_dict = parse_oss_fuzz_report_to_dict(data_clean[0])
+            report = section[:section.find(REPORT_END_MARKER)].decode('unicode_escape')
+            report_dict = parse_oss_fuzz_report_to_dict(report)
             report_dict["id"] = issue_id
 
+            response_validators = {
+                name: response.headers[name] for name in ("ETag", "Last-Modified") if name in response.headers
+            }
+
             # Create and return the OSSFuzzReport object
-            return OSSFuzzIssueReport(**report_dict)
+            return OSSFuzzIssueReport(**report_dict), response_validators
 
         except Exception as e:
             self.app.log.error(f"Error parsing OSS-Fuzz bug report: {str(e)}")
-            return None
+            return None, None
 
     def fetch_issue_id(self, url: str) -> Tuple[str, int]:
         """
@@ -110,20 +187,31 @@ class OSSFuzzHandler(OSSFuzzInterface, HandlersInterface, Handler):
         url_obj = AnyHttpUrl(url)
 
         if url_obj.host == self.old_base_url.host:
-            response = requests.get(url, headers=HTTP_HEADERS, allow_redirects=True)
-            match = re.search(r'const\s+url\s*=\s*"([^"]+)"', response.text)
+            # the id in the query is the old Chromium one, only the redirect target has the OSS-Fuzz id
+            # single get/set operations on the dict, safe when issue ids are resolved from several threads
+            resolved = self._resolved_issue_urls.get(url)
+
+            if resolved:
+                return resolved
+
+            response = self.session.get(url, headers=HTTP_HEADERS, allow_redirects=True)
+            # search the raw body, no need to decode the whole page
+            match = REDIRECT_URL_RE.search(response.content)
 
             if match:
-                redirect_url = match.group(1)
+                redirect_url = match.group(1).decode()
                 self.app.log.info(f"Extracted redirect URL: {redirect_url}")
-                return redirect_url, int(redirect_url.split("/")[-1])
+                resolved = redirect_url, int(redirect_url.rpartition("/")[2])
+                self._resolved_issue_urls[url] = resolved
+
+                return resolved
             elif url_obj.query:
                 self.app.log.warning("Redirect URL not found in response. Fallback to default issue id.")
-                return url, int(url_obj.query.split("=")[-1])
+                return url, int(url_obj.query.rpartition("=")[2])
             else:
                 raise ValueError("Could not extract redirect URL nor the issue ID.")
 
         elif url_obj.host == self.base_url.host:
-            return url, int(url_obj.query.split("/")[-1])
+            return url, int(url_obj.query.rpartition("/")[2])
         else:
             raise Exception(f"Unknown host: {url_obj.host}")
@@ -1,8 +1,12 @@
+import functools
 import requests
 
-from typing import List
+from typing import List, Tuple, Dict
+from concurrent.futures import ThreadPoolExecutor
 from cement import Handler
 from pydantic import HttpUrl
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
 
 from osvutils.types.osv import OSV
 from osvutils.types.event import Fixed, Introduced
@@ -15,6 +19,10 @@ from ..core.interfaces.osv import OSVInterface
 from ..core.models.project import ProjectRange
 
 
+# Connect and read timeouts (seconds) for the OSV API requests
+REQUEST_TIMEOUT = (3.05, 10)
+
+
 class OSVHandler(OSVInterface, HandlersInterface, Handler):
     """
         OSV handler
@@ -29,15 +37,24 @@ class OSVHandler(OSVInterface, HandlersInterface, Handler):
         self.version: str = 'v1'
         self.base_api_url = HttpUrl('https://api.osv.dev')
 
-    @property
+        # keep-alive session, so consecutive lookups reuse the connection to the API
+        self.session = requests.Session()
+        self.session.headers.update(HTTP_HEADERS)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4, pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+        ))
+
+    # validated once; the base URL string carries a trailing slash
+    @functools.cached_property
     def api_url(self) -> HttpUrl:
-        return HttpUrl(f"{self.base_api_url}/{self.version}")
+        return HttpUrl(f"{str(self.base_api_url).rstrip('/')}/{self.version}")
 
-    @property
+    @functools.cached_property
     def vuln_api_url(self) -> HttpUrl:
         return HttpUrl(f"{self.api_url}/vulns")
 
-    def fetch_vulnerability(self, osv_id: str) -> OSV:
+    def fetch_vulnerability(self, osv_id: str) -> Tuple[OSV, bytes]:
         """
         Fetch vulnerability information from OSV API.
 
@@ -45,7 +62,7 @@ class OSVHandler(OSVInterface, HandlersInterface, Handler):
             osv_id: The OSV ID of the vulnerability.
 
         Returns:
-            OSV: The vulnerability record.
+            Tuple[OSV, bytes]: The vulnerability record and the raw JSON response.
 
         Raises:
             OSVError: If fetching the vulnerability fails.
@@ -53,20 +70,48 @@ class OSVHandler(OSVInterface, HandlersInterface, Handler):
         try:
             self.app.log.info(f"Fetching vulnerability {osv_id} from OSV API")
 
-            response = requests.get(url=f"{self.vuln_api_url}/{osv_id}", headers=HTTP_HEADERS)
+            response = self.session.get(url=f"{self.vuln_api_url}/{osv_id}", timeout=REQUEST_TIMEOUT)
 
             if not response.status_code == 200:
                 raise ValueError(
                     f'OSV API returned {response.status_code} for call to {response.url}: {response.text}'
                 )
 
-            json_dict = response.json()
-
-            return OSV(**json_dict)
+            # validated straight from the raw body, without an intermediate dict
+            return OSV.model_validate_json(response.content), response.content
         except Exception as e:
             self.app.log.error(f"Error fetching vulnerability {osv_id}: {str(e)}")
             raise OSVError(f"Failed to fetch vulnerability {osv_id}: {str(e)}")
 
+    def fetch_vulnerabilities(self, osv_ids: List[str], max_workers: int = 8) -> Dict[str, Tuple[OSV, bytes]]:
+        """
+        Fetch several vulnerabilities from the OSV API concurrently.
+
+        Args:
+            osv_ids: The OSV IDs of the vulnerabilities.
+            max_workers: Maximum number of concurrent requests.
+
+        Returns:
+            Dict[str, Tuple[OSV, bytes]]: The record and raw JSON response of each vulnerability,
+            keyed by OSV ID; vulnerabilities that could not be fetched are left out.
+        """
+        results = {}
+
+        if not osv_ids:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(osv_ids))) as executor:
+            futures = {osv_id: executor.submit(self.fetch_vulnerability, osv_id) for osv_id in osv_ids}
+
+        for osv_id, future in futures.items():
+            try:
+                results[osv_id] = future.result()
+            except OSVError:
+                # already logged by fetch_vulnerability
+                continue
+
+        return results
+
     def get_project_ranges(self, osv: OSV) -> List[ProjectRange]:
         project_ranges = []
 
@@ -74,10 +119,11 @@ class OSVHandler(OSVInterface, HandlersInterface, Handler):
             for git_range in affected.get_git_ranges():
                 project_range = ProjectRange(owner=git_range.repo.owner, name=git_range.repo.name)
 
+                # the last introduced/fixed events of the range win, so all events are scanned
                 for event in git_range.events:
                     if isinstance(event, Introduced):
                         project_range.vul_sha = event.version
-                    if isinstance(event, Fixed):
+                    elif isinstance(event, Fixed):
                         project_range.fix_sha = event.version
 
                 if not project_range.vul_sha:
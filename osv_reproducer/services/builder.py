@@ -1,24 +1,44 @@
+import hashlib
+
+from typing import Dict
+
 from ..core.exc import BuilderError
+from ..common.constants import ARCHITECTURE_PLATFORMS, CONTAINER_LOG_CONFIG
 from ..core.models import ReproductionContext
 from ..core.common.enums import ReproductionMode
+from ..utils.parse.log import find_make_error
 from ..core.interfaces import DockerInterface, FileProvisionInterface
 
 
+def _hash_project_files(project_files: Dict[str, bytes]) -> str:
+    """Digest of the build context, so images are shared by the OSS-Fuzz commits that leave the project untouched."""
+    digest = hashlib.sha256()
+
+    for file_name in sorted(project_files):
+        content = project_files[file_name]
+        digest.update(f"{file_name}\0{len(content)}\0".encode())
+        digest.update(content)
+
+    return digest.hexdigest()[:16]
+
+
 class BuilderService:
     def __init__(self, file_provision_handler: FileProvisionInterface, docker_handler: DockerInterface):
         self.docker_handler = docker_handler
         self.file_provision_handler = file_provision_handler
 
     def _build_project_base_image(self, project_name: str, oss_fuzz_repo_sha: str) -> str:
-        image_tag = f"osv-reproducer/{project_name}-{oss_fuzz_repo_sha}:latest"
+        project_files = self.file_provision_handler.get_project_files(project_name, oss_fuzz_repo_sha)
+
+        if project_files is None:
+            raise BuilderError(f"Project {project_name} not found in the file provisioner")
+
+        image_tag = f"osv-reproducer/{project_name}-{_hash_project_files(project_files)}:latest"
 
         # if the image exists, return its tag
         if not self.docker_handler.check_image_exists(image_tag):
             project_path = self.file_provision_handler.get_project_path(project_name, oss_fuzz_repo_sha)
 
-            if not project_path:
-                raise BuilderError(f"Project {project_name} not found in the file provisioner")
-
             if not self.docker_handler.build_image(
                 context_path=project_path, tag=image_tag, remove_containers=False
             ):
@@ -30,7 +50,7 @@ class BuilderService:
             self, context: ReproductionContext, image_name: str, repositories: dict, extra_args: dict = None,
             reproduce: bool = False
     ) -> str:
-        platform = 'linux/arm64' if context.issue_report.architecture == 'aarch64' else 'linux/amd64'
+        platform = ARCHITECTURE_PLATFORMS.get(context.issue_report.architecture, 'linux/amd64')
 
         # Environment variables for the container
         environment = {
@@ -83,15 +103,17 @@ class BuilderService:
                 environment=environment,
                 volumes=volumes,
                 tty=False,
-                stdin_open=True
+                stdin_open=False,
+                init=True,
+                log_config=CONTAINER_LOG_CONFIG
         ):
             raise BuilderError(f"Failed to run container {context.fuzzer_container_name}: empty container ID returned")
 
         # Stream and display logs in real-time
-        self.docker_handler.stream_container_logs(context.fuzzer_container_name)
+        logs_tail = self.docker_handler.stream_container_logs(context.fuzzer_container_name, max_lines=10)
 
         # if there is an error in the build process, we should find it at the end of the logs
-        error_code = self.docker_handler.find_log_error_code(context.fuzzer_container_name)
+        error_code = find_make_error(logs_tail)
 
         if error_code:
             raise BuilderError(f"Build failed with error code {error_code}")
@@ -1,4 +1,5 @@
-from typing import Optional, Dict
+from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
 from osvutils.types.osv import OSV
 from datetime import datetime, timedelta
 
@@ -13,9 +14,13 @@ from ..core.interfaces import OSVInterface, OSSFuzzInterface, FileProvisionInter
 class ContextService:
     def __init__(
             self, file_provision_handler: FileProvisionInterface, gcs_handler: GCSInterface,
-            github_handler: GithubInterface, oss_fuzz_handler: OSSFuzzInterface, osv_handler: OSVInterface
+            github_handler: GithubInterface, oss_fuzz_handler: OSSFuzzInterface, osv_handler: OSVInterface,
+            revalidate_snapshots: bool = False, revalidate_issue_reports: bool = False, max_workers: int = 4
     ):
         self.file_provision_handler = file_provision_handler
+        self.max_workers = max_workers
+        self.revalidate_snapshots = revalidate_snapshots
+        self.revalidate_issue_reports = revalidate_issue_reports
         self.gcs_handler = gcs_handler
         self.github_handler = github_handler
         self.oss_fuzz_handler = oss_fuzz_handler
@@ -25,12 +30,12 @@ class ContextService:
         osv_record = self.file_provision_handler.get_osv_record(osv_id)
 
         if not osv_record:
-            osv_record = self.osv_handler.fetch_vulnerability(osv_id)
+            osv_record, content = self.osv_handler.fetch_vulnerability(osv_id)
 
             if not osv_record:
                 raise ContextError(f"Could not fetch OSV record for {osv_id}")
 
-            self.file_provision_handler.save_osv_record(osv_record)
+            self.file_provision_handler.save_osv_record(osv_record, content)
 
         return osv_record
 
@@ -43,8 +48,7 @@ class ContextService:
                 _, issue_id = self.oss_fuzz_handler.fetch_issue_id(ref.url)
 
                 if issue_id:
-                    if not self.file_provision_handler.set_issue_id(osv_record.id, issue_id):
-                        raise ContextError(f"Could not save issue ID for {osv_record.id}")
+                    self.file_provision_handler.set_issue_id(osv_record.id, issue_id)
                     break
 
             if not issue_id:
@@ -55,33 +59,100 @@ class ContextService:
     def _get_issue_report(self, issue_id: int) -> OSSFuzzIssueReport:
         issue_report = self.file_provision_handler.load_issue_report(issue_id)
 
+        if issue_report and self.revalidate_issue_reports:
+            validators = self.file_provision_handler.load_issue_report_validators(issue_id)
+            # only downloads the issue page again if it changed
+            latest, latest_validators = self.oss_fuzz_handler.fetch_issue_report_if_modified(issue_id, validators)
+
+            if latest:
+                issue_report = latest
+                self.file_provision_handler.save_issue_report(issue_report, validators=latest_validators)
+
         if not issue_report:
-            issue_report = self.oss_fuzz_handler.fetch_issue_report(issue_id)
+            issue_report, validators = self.oss_fuzz_handler.fetch_issue_report_if_modified(issue_id)
 
             if not issue_report:
                 raise ContextError(f"Could not fetch OSS-Fuzz Issue Report for {issue_id}")
 
-            self.file_provision_handler.save_issue_report(issue_report)
+            self.file_provision_handler.save_issue_report(issue_report, validators=validators)
 
         return issue_report
 
+    def _resolve_issue_report(self, osv_id: str) -> OSSFuzzIssueReport:
+        osv_record = self._get_osv_record(osv_id)
+        issue_id = self._get_issue_id(osv_record)
+
+        return self._get_issue_report(issue_id)
+
+    def get_issue_reports(self, osv_ids: List[str], max_workers: int = 8) -> Dict[str, OSSFuzzIssueReport]:
+        """
+        Resolve the OSS-Fuzz issue reports of several OSV records concurrently.
+
+        Args:
+            osv_ids: The OSV IDs to resolve.
+            max_workers: Maximum number of records resolved at the same time.
+
+        Returns:
+            Dictionary mapping each OSV ID to its issue report; records that could not be resolved are left out.
+        """
+        issue_reports = {}
+        # repeated ids would resolve (and save) the same report from several threads
+        osv_ids = list(dict.fromkeys(osv_ids))
+
+        if not osv_ids:
+            return issue_reports
+
+        # fetch the records missing locally in one go
+        missing = [osv_id for osv_id in osv_ids if not self.file_provision_handler.get_osv_record(osv_id)]
+
+        for osv_record, content in self.osv_handler.fetch_vulnerabilities(missing, max_workers).values():
+            self.file_provision_handler.save_osv_record(osv_record, content)
+
+        # the lookups are I/O bound and independent from each other
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(osv_ids))) as executor:
+            futures = {osv_id: executor.submit(self._resolve_issue_report, osv_id) for osv_id in osv_ids}
+
+        for osv_id, future in futures.items():
+            try:
+                issue_reports[osv_id] = future.result()
+            except Exception as e:
+                # besides ContextError, the handlers raise their own errors (e.g., OSVError for an unknown record)
+                # or let request errors through; a single record must not fail the others
+                print(f"Could not resolve the issue report for {osv_id}: {e}")
+
+        return issue_reports
+
     def _check_testcase(self, issue_report: OSSFuzzIssueReport):
         if not self.file_provision_handler.get_testcase_path(issue_report.testcase_id):
-            testcase = self.oss_fuzz_handler.fetch_test_case_content(issue_report.testcase_url)
+            testcase_path = self.file_provision_handler.get_testcase_path(issue_report.testcase_id, check=False)
 
-            if not testcase:
+            # streamed straight to disk, test cases can be large
+            if not self.oss_fuzz_handler.fetch_test_case(issue_report.testcase_url, testcase_path):
                 raise ContextError(f"Could not fetch test case content for {issue_report.testcase_url}")
 
-            if not self.file_provision_handler.save_testcase(issue_report.testcase_id, testcase):
-                raise ContextError(f"Could not save test case content for {issue_report.testcase_id}")
-
     def _get_snapshot(self, osv_id: str, timestamp: str, issue_report: OSSFuzzIssueReport) -> dict:
         snapshot = self.file_provision_handler.load_snapshot(
             project_name=issue_report.project, sanitizer=issue_report.sanitizer, timestamp=timestamp
         )
 
+        if snapshot and self.revalidate_snapshots:
+            generation = self.file_provision_handler.load_snapshot_generation(
+                project_name=issue_report.project, sanitizer=issue_report.sanitizer, timestamp=timestamp
+            )
+            # only downloads the srcmap again if its generation changed
+            latest, latest_generation = self.gcs_handler.fetch_snapshot_if_modified(
+                project_name=issue_report.project, sanitizer=issue_report.sanitizer, timestamp=timestamp,
+                generation=generation
+            )
+
+            if latest:
+                snapshot = latest
+                self.file_provision_handler.save_snapshot(
+                    snapshot, issue_report.project, issue_report.sanitizer, timestamp, generation=latest_generation
+                )
+
         if not snapshot:
-            snapshot = self.gcs_handler.fetch_snapshot_by_timestamp(
+            snapshot, generation = self.gcs_handler.fetch_snapshot_if_modified(
                 project_name=issue_report.project, sanitizer=issue_report.sanitizer, timestamp=timestamp
             )
 
@@ -90,7 +161,7 @@ class ContextService:
                     f"Could not get {issue_report.project}-{issue_report.sanitizer}-{timestamp} snapshot")
 
             self.file_provision_handler.save_snapshot(
-                snapshot, issue_report.project, issue_report.sanitizer, timestamp
+                snapshot, issue_report.project, issue_report.sanitizer, timestamp, generation=generation
             )
             self.file_provision_handler.set_osv_timestamp(osv_id, timestamp)
 
@@ -106,8 +177,7 @@ class ContextService:
             if not oss_fuzz_repo_sha:
                 raise ContextError(f"Could not find OSS-Fuzz repository commit at timestamp {timestamp}")
 
-            if not self.file_provision_handler.set_oss_fuzz_repo_sha(timestamp, oss_fuzz_repo_sha):
-                raise ContextError(f"Could not save OSS-Fuzz repository commit at timestamp {timestamp}")
+            self.file_provision_handler.set_oss_fuzz_repo_sha(timestamp, oss_fuzz_repo_sha)
 
         return oss_fuzz_repo_sha
 
@@ -142,36 +212,63 @@ class ContextService:
 
         return project_files
 
+    def _clone_repository(self, url: str, owner: str, repo: str, rev: str):
+        repo_path = self.file_provision_handler.get_repository_path(
+            owner=owner, repository=repo, version=rev, check=False
+        )
+
+        if not self.github_handler.clone_repository(repo_url=url, commit=rev, to_path=repo_path):
+            raise ContextError(f"Could not clone repository {url} at commit {rev}")
+
     def _init_repositories(self, snapshot: dict) -> dict:
         # TODO: maybe the mapping should be done in the snapshot itself
         repositories = {}
+        entries = {}
 
         for path, _values in snapshot.items():
-            if _values["type"] != "git":
+            repo_type = _values.get("type")
+
+            if repo_type != "git":
                 # TODO: support other types of repositories
-                print(f"Unsupported host type: {_values['type']} for {path}")
+                print(f"Unsupported host type: {repo_type} for {path}")
                 continue
 
-            owner, repo = self.github_handler.check_repo_url(_values["url"])
+            url, rev = _values.get("url"), _values.get("rev")
 
-            if not owner or not repo:
-                print(f"Invalid repository URL: {_values['url']} for {path}.")
+            if not url or not rev:
+                print(f"Incomplete snapshot entry for {path}: {_values}")
                 continue
 
-            repositories[path] = {
-                "owner": owner,
-                "repository": repo,
-                "version": _values["rev"]
-            }
+            entries[path] = url, rev
 
-            repo_path = self.file_provision_handler.get_repository_path(
-                owner=owner, repository=repo, version=_values["rev"], check=False
-            )
+        if not entries:
+            raise ContextError("No valid repositories found in the snapshot")
 
-            if not self.github_handler.clone_repository(
-                    repo_url=_values["url"], commit=_values["rev"], to_path=repo_path
-            ):
-                raise ContextError(f"Could not clone repository {_values['url']} at commit {_values['rev']}")
+        # the lookups and clones are I/O bound and independent from each other
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(entries))) as executor:
+            urls = list(dict.fromkeys(url for url, _ in entries.values()))
+            repo_names = dict(zip(urls, executor.map(self.github_handler.check_repo_url, urls)))
+            clones = {}
+
+            for path, (url, rev) in entries.items():
+                owner, repo = repo_names[url]
+
+                if not owner or not repo:
+                    print(f"Invalid repository URL: {url} for {path}.")
+                    continue
+
+                repositories[path] = {
+                    "owner": owner,
+                    "repository": repo,
+                    "version": rev
+                }
+
+                # different paths or URLs can point to the same checkout, clone it only once
+                if (owner, repo, rev) not in clones:
+                    clones[(owner, repo, rev)] = executor.submit(self._clone_repository, url, owner, repo, rev)
+
+        for future in clones.values():
+            future.result()
 
         if not repositories:
             raise ContextError("No valid repositories found in the snapshot")
@@ -1,5 +1,9 @@
+import threading
 import traceback
 
+from typing import Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+
 from .context import ContextService
 from .builder import BuilderService
 from .runner import RunnerService
@@ -13,12 +17,14 @@ from ..core.exc import ContextError, BuilderError, RunnerError, VerifierError
 class ReproducerService:
     def __init__(
             self, context_service: ContextService, builder_service: BuilderService, runner_service: RunnerService,
-            verifier_service: VerifierService
+            verifier_service: VerifierService, max_builds: int = 2
     ):
         self._context = context_service
         self._builder = builder_service
         self._runner = runner_service
         self._verifier = verifier_service
+        # bounds the builds hitting the Docker daemon at once when reproducing in batch
+        self._build_slots = threading.BoundedSemaphore(max_builds)
 
     def __call__(
             self, osv_id: str, mode: ReproductionMode, build_extra_args: dict = None, reproduce: bool = False
@@ -27,7 +33,10 @@ class ReproducerService:
 
         try:
             run_status.context_ok = self._context(osv_id, mode)
-            run_status.builder_ok = self._builder(osv_id, mode, build_extra_args, reproduce=reproduce)
+
+            with self._build_slots:
+                run_status.builder_ok = self._builder(osv_id, mode, build_extra_args, reproduce=reproduce)
+
             run_status.runner_ok = self._runner(osv_id, mode)
             run_status.verifier_ok = self._verifier(osv_id, mode)
         except ContextError as e:
@@ -51,3 +60,51 @@ class ReproducerService:
             run_status.exit_code = 70
 
         return run_status
+
+    def batch(
+            self, items: List[Tuple[str, ReproductionMode]], build_extra_args: dict = None, reproduce: bool = False,
+            max_workers: int = 4
+    ) -> List[RunStatus]:
+        """
+        Runs the reproduction pipeline for several (osv_id, mode) pairs concurrently.
+
+        Pairs of the same OSV ID run one after the other, since they share the issue report, test case, records
+        and repository checkouts; different OSV IDs run in parallel.
+
+        Args:
+            items: The (osv_id, mode) pairs to process.
+            build_extra_args: Extra environment variables for the fuzzer containers.
+            reproduce: Whether to build the fuzzers with libFuzzer for reproduction.
+            max_workers: Maximum number of OSV IDs processed at the same time.
+
+        Returns:
+            List[RunStatus]: The run status of each pair, in the same order as the items.
+        """
+        # duplicated pairs would build and run the same containers concurrently
+        modes_by_osv_id: Dict[str, List[ReproductionMode]] = {}
+
+        for osv_id, mode in dict.fromkeys(items):
+            modes_by_osv_id.setdefault(osv_id, []).append(mode)
+
+        try:
+            # resolves the OSV records and issue reports in one concurrent pass, the pipelines then find them cached
+            self._context.get_issue_reports(list(modes_by_osv_id), max_workers=max_workers)
+        except Exception as e:
+            # single records failing are left out by get_issue_reports, this is a failure of the whole pass (e.g.,
+            # the OSV API being unreachable); not fatal, each pipeline resolves its records again and reports the
+            # failure in its run status
+            print(f"Could not prefetch the issue reports: {e}")
+
+        def _run_osv_id(osv_id: str) -> Dict[Tuple[str, ReproductionMode], RunStatus]:
+            return {
+                (osv_id, mode): self(osv_id, mode, build_extra_args, reproduce=reproduce)
+                for mode in modes_by_osv_id[osv_id]
+            }
+
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for osv_id_results in executor.map(_run_osv_id, modes_by_osv_id):
+                results.update(osv_id_results)
+
+        return [results[item] for item in items]
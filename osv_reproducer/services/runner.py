@@ -1,6 +1,7 @@
 from typing import Optional
 
 from ..core.exc import RunnerError
+from ..common.constants import ARCHITECTURE_PLATFORMS, CONTAINER_LOG_CONFIG
 from ..core.common.enums import ReproductionMode
 from ..core.models import ReproductionContext, CrashInfo
 from ..utils.parse.log import parse_reproduce_logs_to_dict
@@ -29,16 +30,19 @@ class RunnerService:
             context.id, context.mode.value, context.issue_report.fuzz_target
         )
 
-        if not fuzzer_path.exists():
-            raise RunnerError(f"Fuzzer does not exist at {fuzzer_path}")
+        # get_output_path already checked the file, it returns None when it is missing
+        if not fuzzer_path:
+            raise RunnerError(
+                f"Fuzzer {context.issue_report.fuzz_target} does not exist in the output of {context.id}"
+            )
 
         test_case_path = self.file_provision_handler.get_testcase_path(context.issue_report.testcase_id)
 
         if not test_case_path:
             raise RunnerError(f"Test case {context.issue_report.testcase_id} not found in the file provisioner")
 
-        if self.docker_handler.check_container_exists(context.runner_container_name):
-            self.docker_handler.remove_container(context.runner_container_name)
+        # best-effort removal of a previous run, a missing container is not an error
+        self.docker_handler.remove_container(context.runner_container_name)
 
         # Environment variables for the container
         environment = {
@@ -59,11 +63,13 @@ class RunnerService:
             image='gcr.io/oss-fuzz-base/base-runner:latest',
             container_name=context.runner_container_name,
             command=['reproduce', context.issue_report.fuzz_target, '-runs=1'],
-            platform='linux/arm64' if context.issue_report.architecture == 'aarch64' else 'linux/amd64',
+            platform=ARCHITECTURE_PLATFORMS.get(context.issue_report.architecture, 'linux/amd64'),
             environment=environment,
             volumes=volumes,
             tty=False,
-            stdin_open=True
+            stdin_open=False,
+            init=True,
+            log_config=CONTAINER_LOG_CONFIG
         ):
             raise RunnerError(f"Failed to run container {context.runner_container_name}: empty container ID returned")
 
@@ -1,3 +1,5 @@
+from typing import Tuple
+
 from ..core.exc import VerifierError
 from ..core.common.enums import ReproductionMode
 from ..core.interfaces import FileProvisionInterface
@@ -24,48 +26,44 @@ def _check_basic_fields(
         raise VerifierError(f"Address mismatch: {crash_info.address} != {issue_report.crash_info.address}")
 
 
-def _compute_stack_shift(issue_report: OSSFuzzIssueReport, crash_info: CrashInfo,):
+def _frame_names(crash_info: CrashInfo) -> Tuple[str, ...]:
+    return tuple(frame.location.logical_locations[0].name for frame in crash_info.stack.frames)
+
+
+def _compute_stack_shift(report_frame_names: Tuple[str, ...], crash_frame_names: Tuple[str, ...]) -> int:
     # Check if we need to shift the crash_info stack frames
     # This handles cases where the first frame could be a sanitizer function (like __asan_memcpy)
     shift = 0
 
-    if len(crash_info.stack.frames) > 1:
-        report_first_frame = issue_report.crash_info.stack.frames[0].location.logical_locations[0].name
-        crash_first_frame = crash_info.stack.frames[0].location.logical_locations[0].name
+    if len(crash_frame_names) > 1:
+        report_first_frame = report_frame_names[0]
 
-        if report_first_frame != crash_first_frame:
+        if report_first_frame != crash_frame_names[0]:
             # Try to find a matching frame by shifting through the crash frames
-            for potential_shift in range(1, len(crash_info.stack.frames)):
-                crash_frame = crash_info.stack.frames[potential_shift].location.logical_locations[0].name
-
-                if report_first_frame == crash_frame:
-                    print(f"First frame did not match, shifting stack frames by {potential_shift}")
-                    return potential_shift
+            try:
+                potential_shift = crash_frame_names.index(report_first_frame, 1)
+            except ValueError:
+                raise VerifierError("No matching stack frames found after shifting through all frames")
 
-            raise VerifierError("No matching stack frames found after shifting through all frames")
+            print(f"First frame did not match, shifting stack frames by {potential_shift}")
+            return potential_shift
 
     return shift
 
 
 def _check_stack_frames(
-        issue_report: OSSFuzzIssueReport, crash_info: CrashInfo, shift: int, min_match: int = 1
+        report_frame_names: Tuple[str, ...], crash_frame_names: Tuple[str, ...], shift: int, min_match: int = 1
 ) -> list:
-    # Check stack frames
-    report_frames_count = len(issue_report.crash_info.stack.frames)
-
     # Check if we have at least one frame to compare
-    if report_frames_count == 0 or len(crash_info.stack.frames) == 0:
+    if not report_frame_names or not crash_frame_names:
         raise VerifierError("No stack frames to compare")
 
-    matched_frames = []
-
     # Compare stack frames (only as many as in the OSSFuzzIssueReport)
-    for i in range(min(report_frames_count, len(crash_info.stack.frames) - shift)):
-        report_frame_name = issue_report.crash_info.stack.frames[i].location.logical_locations[0].name
-        crash_frame_name = crash_info.stack.frames[i + shift].location.logical_locations[0].name
-
-        if report_frame_name == crash_frame_name:
-            matched_frames.append(report_frame_name)
+    matched_frames = [
+        report_frame_name
+        for report_frame_name, crash_frame_name in zip(report_frame_names, crash_frame_names[shift:])
+        if report_frame_name == crash_frame_name
+    ]
 
     if len(matched_frames) < min_match:
         raise VerifierError(f"Not enough matching stack frames found: {matched_frames}")
@@ -88,10 +86,16 @@ class VerifierService:
         if crash_info:
             if mode == ReproductionMode.FIX:
                 raise VerifierError(f"{context.id} patch did not address the crash:\n{crash_info}")
+            elif crash_info == context.issue_report.crash_info and crash_info.stack.frames:
+                # identical crash, every check below would pass
+                return True
             else:
                 _check_basic_fields(context.issue_report, crash_info)
-                shift = _compute_stack_shift(context.issue_report, crash_info)
-                _check_stack_frames(context.issue_report, crash_info, shift)
+                # frame names are resolved once and shared by the shift search and the comparison
+                report_frame_names = _frame_names(context.issue_report.crash_info)
+                crash_frame_names = _frame_names(crash_info)
+                shift = _compute_stack_shift(report_frame_names, crash_frame_names)
+                _check_stack_frames(report_frame_names, crash_frame_names, shift)
         else:
             if mode == ReproductionMode.CRASH:
                 raise VerifierError(f"Could not reproduce crash for {context.id}")
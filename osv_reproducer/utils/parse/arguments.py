@@ -1,9 +1,15 @@
+import re
+
+# "KEY: VALUE" pairs separated by '|', the value may itself contain ':' (e.g., URLs)
+KEY_VALUE_PAIR_PATTERN = re.compile(r'\s*([^:|]+?)\s*:\s*([^|]*?)\s*(?:\||$)')
+
+
 def parse_key_value_string(key_value_string: str) -> dict:
     """
-    Parse a string in the format "KEY1:VALUE1,KEY2:VALUE2" into a dictionary.
+    Parse a string in the format "KEY1:VALUE1|KEY2:VALUE2" into a dictionary.
 
     Args:
-        key_value_string: String in the format "KEY1:VALUE1,KEY2:VALUE2".
+        key_value_string: String in the format "KEY1:VALUE1|KEY2:VALUE2".
 
     Returns:
         dict: Dictionary with the parsed key-value pairs.
@@ -11,12 +17,4 @@ def parse_key_value_string(key_value_string: str) -> dict:
     if not key_value_string:
         return {}
 
-    result = {}
-    pairs = key_value_string.split('|')
-
-    for pair in pairs:
-        if ':' in pair:
-            key, value = pair.split(':', 1)  # Split on first occurrence of ':'
-            result[key.strip()] = value.strip()
-
-    return result
+    return dict(KEY_VALUE_PAIR_PATTERN.findall(key_value_string))
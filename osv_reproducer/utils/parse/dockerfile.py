@@ -1,5 +1,10 @@
+import shlex
+
 from typing import List, Tuple, Optional, Dict
 
+COPY_ADD_PREFIX = ('COPY ', 'ADD ')
+URL_SCHEMES = ('http://', 'https://')
+
 
 def parse_instruction(line: str) -> Tuple[List[str], str]:
     """
@@ -13,7 +18,12 @@ def parse_instruction(line: str) -> Tuple[List[str], str]:
             - sources: List of source paths.
             - destination: Destination path.
     """
-    parts = line.split(' ')
+    try:
+        # handles quoted paths and repeated whitespace between arguments
+        parts = shlex.split(line)
+    except ValueError:
+        # unbalanced quotes, fall back to plain whitespace splitting
+        parts = line.split()
 
     # Get all source files (everything except the last part which is destination)
     sources = parts[1:-1]
@@ -89,32 +99,30 @@ def parse_mount_sources(dockerfile: List[str]) -> Tuple[Dict[str, str], Dict[str
 
     downloadable_files, mount_files = {}, {}
 
-    for line in dockerfile:
-        line = line.strip()
+    instructions = [line for line in map(str.strip, dockerfile) if line.startswith(COPY_ADD_PREFIX)]
+
+    for line in instructions:
+        sources, destination = parse_instruction(line)
+        mount_path = process_destination(destination)
+
+        if not mount_path:
+            continue
 
         if line.startswith('ADD '):
-            sources, destination = parse_instruction(line)
-            mount_path = process_destination(destination)
-
-            if mount_path:
-                for source in sources:
-                    if source.startswith('http://') or source.startswith('https://'):
-                        downloadable_files[source] = mount_path
-                    elif is_valid_source(source):
+            for source in sources:
+                if source.startswith(URL_SCHEMES):
+                    downloadable_files[source] = mount_path
+                elif is_valid_source(source):
+                    mount_files[source] = mount_path
+        else:
+            for source in sources:
+                if is_valid_source(source):
+                    if source in mount_path:
                         mount_files[source] = mount_path
-        if line.startswith('COPY '):
-            sources, destination = parse_instruction(line)
-            mount_path = process_destination(destination)
-
-            if mount_path:
-                for source in sources:
-                    if is_valid_source(source):
-                        if source in mount_path:
-                            mount_files[source] = mount_path
+                    else:
+                        if mount_path[-1] == '/':
+                            mount_files[source] = mount_path + source
                         else:
-                            if mount_path[-1] == '/':
-                                mount_files[source] = mount_path + source
-                            else:
-                                mount_files[source] = mount_path + '/' + source
+                            mount_files[source] = mount_path + '/' + source
 
     return downloadable_files, mount_files
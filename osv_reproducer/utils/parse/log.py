@@ -1,12 +1,22 @@
 import re
-from typing import List, Dict, Any, Optional
+import sys
+import functools
+
+from itertools import chain, islice
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
 
 from osv_reproducer.utils.parse.common import create_frame, create_stack_dict
 
-MEMORY_ACCESS_PATTERN = r'(\w+) of size (\d+) at (0x[0-9a-fA-F]+) thread (T\d+)'
-SIGNAL_PATTERN = r'The signal is caused by a (\w+) memory access\.'
-DESCRIPTION_PATTERN = r'(\w[\w\-]+) on address (0x[0-9a-fA-F]+) at pc (0x[0-9a-fA-F]+) bp (0x[0-9a-fA-F]+) sp (0x[0-9a-fA-F]+)'
-SEGV_PATTERN = r'SEGV on unknown address (0x[0-9a-fA-F]+)'
+# the line after the error header, either a memory access or (for SEGV) the signal cause
+# impacts and operations come from a small vocabulary, so the captured values are interned
+ERROR_DETAILS_PATTERN = re.compile(
+    r'(?P<operation>\w+) of size (?P<size>\d+) at (?P<address>0x[0-9a-fA-F]+) thread T\d+'
+    r'|The signal is caused by a (?P<signal_operation>\w+) memory access\.'
+)
+DESCRIPTION_PATTERN = re.compile(
+    r'(\w[\w\-]+) on address (0x[0-9a-fA-F]+) at pc (0x[0-9a-fA-F]+) bp (0x[0-9a-fA-F]+) sp (0x[0-9a-fA-F]+)'
+)
+SEGV_PATTERN = re.compile(r'SEGV on unknown address (0x[0-9a-fA-F]+)')
 MAKE_ERROR_PATTERN = re.compile(
     r'^make:\s+\*\*\*\s+\[(?P<file>[^:\]]+):(?P<line>\d+):\s*(?P<target>[^\]]+)\]\s+Error\s+(?P<code>\d+)\s*$'
 )
@@ -14,7 +24,7 @@ MAKE_ERROR_PATTERN = re.compile(
 
 def find_make_error(lines: List[str]) -> Optional[int]:
     for line in lines:
-        match = re.match(MAKE_ERROR_PATTERN, line)
+        match = MAKE_ERROR_PATTERN.match(line)
 
         if match:
             match_dict = match.groupdict()
@@ -23,6 +33,63 @@ def find_make_error(lines: List[str]) -> Optional[int]:
     return None
 
 
+def parse_error_header(line: str) -> Optional[dict]:
+    """
+    Extract the error description from a sanitizer error header line (e.g., "==1==ERROR: AddressSanitizer: ...").
+
+    Args:
+        line: A line of the log output
+
+    Returns:
+        dict: Dictionary with the impact and address, or None if the line is not an error header
+    """
+    # the substring test is the cheapest and rules out almost every line
+    if "==ERROR" in line and line.lstrip().startswith("=="):
+        # Extract the error description from this line (the text after the last ':')
+        if line.count(":") > 1:
+            description = line.rpartition(":")[2]
+            match = DESCRIPTION_PATTERN.search(description)
+
+            if match:
+                return {"impact": sys.intern(match.group(1)), "address": match.group(2)}
+
+            # Check for SEGV errors which have a different format
+            segv_match = SEGV_PATTERN.search(description)
+            if segv_match:
+                return {"impact": "SEGV", "address": segv_match.group(1)}
+
+    return None
+
+
+def parse_error_details(error_line: str) -> dict:
+    """
+    Extract error information from the line following the error header.
+
+    Args:
+        error_line: The line following the error header
+
+    Returns:
+        dict: Dictionary with error information (operation, size, address)
+    """
+    match = ERROR_DETAILS_PATTERN.search(error_line)
+
+    if not match:
+        return {}
+
+    if match.group('operation'):
+        return {
+            'operation': sys.intern(match.group('operation')), 'size': int(match.group('size')),
+            'address': match.group('address')
+        }
+
+    # Check for SEGV errors which have a different format, the cause is reported by the sanitizer (==PID==...)
+    if error_line.lstrip().startswith("=="):
+        # For SEGV errors, size is None
+        return {'operation': sys.intern(match.group('signal_operation')), 'size': None}
+
+    return {}
+
+
 def find_error_start(log_lines: List[str]) -> tuple:
     """
     Find the start line of an error in sanitizer logs and extract the description.
@@ -37,20 +104,10 @@ def find_error_start(log_lines: List[str]) -> tuple:
     """
 
     for i, line in enumerate(log_lines):
-        if line.strip().startswith("==") and "==ERROR" in line:
-            # Extract the error description from this line
-            description_parts = line.split(":")
-
-            if len(description_parts) > 2:
-                match = re.search(DESCRIPTION_PATTERN, description_parts[-1])
-
-                if match:
-                    return i, {"impact": match.group(1), "address": match.group(2)}
+        info = parse_error_header(line)
 
-                # Check for SEGV errors which have a different format
-                segv_match = re.search(SEGV_PATTERN, description_parts[-1])
-                if segv_match:
-                    return i, {"impact": "SEGV", "address": segv_match.group(1)}
+        if info:
+            return i, info
 
     return -1, None
 
@@ -66,27 +123,10 @@ def extract_error_info(log_lines: List[str], start_idx: int) -> dict:
     Returns:
         dict: Dictionary with error information (operation, size, address)
     """
-    error_info = {}
-
     if start_idx == -1 or start_idx + 1 >= len(log_lines):
-        return error_info
-
-    error_line = log_lines[start_idx + 1]
-    match = re.search(MEMORY_ACCESS_PATTERN, error_line)
+        return {}
 
-    if match:
-        error_info['operation'] = match.group(1)
-        error_info['size'] = int(match.group(2))
-        error_info['address'] = match.group(3)
-    elif error_line.strip().startswith("=="):
-        # Check for SEGV errors which have a different format
-        signal_match = re.search(SIGNAL_PATTERN, error_line)
-        if signal_match:
-            error_info['operation'] = signal_match.group(1)
-            # For SEGV errors, size is None
-            error_info['size'] = None
-
-    return error_info
+    return parse_error_details(log_lines[start_idx + 1])
 
 
 def extract_scariness(log_lines: List[str], start_idx: int) -> tuple:
@@ -113,46 +153,49 @@ def extract_scariness(log_lines: List[str], start_idx: int) -> tuple:
     return None, i
 
 
-def collect_stack_trace(log_lines: List[str], start_idx: int) -> tuple:
+def iter_stack_trace(log_lines: Iterable[str]) -> Iterator[str]:
     """
-    Collect stack trace lines from the log.
+    Yield the lines of the first stack trace in the log, the scan stops at its end or at the SUMMARY line.
 
     Args:
-        log_lines: List of strings containing the log output
-        start_idx: Index to start collecting from
+        log_lines: Lines of the log output, any iterable (e.g., a file object) is consumed only as far as needed
 
-    Returns:
-        tuple: (trace_lines, next_index) where:
-            - trace_lines: List of stack trace lines
-            - next_index: Index to continue parsing from
+    Yields:
+        str: The stripped stack trace lines
     """
-    trace_lines = []
-    i = start_idx
-    main_trace_ended = False
+    in_trace = False
+
+    for raw_line in log_lines:
+        if raw_line.startswith("SUMMARY:"):
+            return
+
+        line = raw_line.strip()
 
-    while i < len(log_lines) and not log_lines[i].startswith("SUMMARY:"):
-        line = log_lines[i].strip()
         if line.startswith("#"):
-            if not main_trace_ended:
-                trace_lines.append(line)
-        elif trace_lines and not line.startswith("DEDUP_TOKEN:"):
+            in_trace = True
+            yield line
+        elif in_trace and not line.startswith("DEDUP_TOKEN:"):
             # We've reached the end of the first stack trace
-            main_trace_ended = True
-        i += 1
+            return
 
-    return trace_lines, i
 
-
-def parse_stack_frame(line: str) -> Optional[Dict[str, Any]]:
+def collect_stack_trace(log_lines: Iterable[str], start_idx: int = 0) -> List[str]:
     """
-    Parse a stack frame line and create a frame dictionary.
+    Collect the lines of the first stack trace in the log.
 
     Args:
-        line: Stack frame line in the format "#N address in function file" or "#N address (module)"
+        log_lines: Lines of the log output, any iterable (e.g., a file object) is consumed only as far as needed
+        start_idx: Index to start collecting from
 
     Returns:
-        dict: Frame dictionary or None if the line couldn't be parsed
+        List[str]: The stack trace lines, the scan stops at the end of the first trace or at the SUMMARY line
     """
+    return list(iter_stack_trace(islice(log_lines, start_idx, None)))
+
+
+# the same frames show up in every log of a crash, only the (immutable) strings are cached, never the frame dicts
+@functools.lru_cache(maxsize=4096)
+def _parse_frame_line(line: str) -> Optional[Tuple[str, str, str]]:
     # Check if the line starts with a frame number
     if not line.startswith("#"):
         return None
@@ -167,31 +210,30 @@ def parse_stack_frame(line: str) -> Optional[Dict[str, Any]]:
 
     # Check if the line has the " in " format
     if len(frame_parts) > 2 and " in " in line:
-        parts = line.split(" in ", 1)
-        frame_id = parts[0].strip()  # e.g., "#0 0x55c8c1c740d8"
-        location_part = parts[1].strip()  # e.g., "MqttClient_DecodePacket mqtt_client.c"
+        frame_id, _, location_part = line.partition(" in ")
+        frame_id = frame_id.strip()  # e.g., "#0 0x55c8c1c740d8"
+        location_part = location_part.strip()  # e.g., "MqttClient_DecodePacket mqtt_client.c"
 
         # Check if the location part starts with a function name followed by a module in parentheses
         if location_part.strip().endswith(")") and "(" in location_part and not location_part.strip().startswith("("):
             # This is likely a function name followed by a module in parentheses
             # Extract the function name (everything before the first open parenthesis)
-            function_parts = location_part.split("(", 1)
-            function = function_parts[0].strip()
+            function, _, module = location_part.partition("(")
+            function = function.strip()
 
             # The module is everything from the first open parenthesis to the end
-            file = "(" + function_parts[1]
+            file = "(" + module
         # Check if the function name includes a signature (has parentheses)
         elif "(" in location_part and ")" in location_part and location_part.find("(") < location_part.find(")"):
             # Extract the function name without the signature
-            function = location_part.split("(", 1)[0].strip()
+            function = location_part.partition("(")[0].strip()
             # Extract the file part which comes after the closing parenthesis and a space
-            file_parts = location_part.split(")", 1)
-            file = file_parts[1].strip() if len(file_parts) > 1 else ""
+            file = location_part.partition(")")[2].strip()
         else:
             # Handle the case where there's no signature
-            location_parts = location_part.split(" ", 1)
-            function = location_parts[0].strip()
-            file = location_parts[1].strip() if len(location_parts) > 1 else ""
+            function, _, file = location_part.partition(" ")
+            function = function.strip()
+            file = file.strip()
     else:
         # Handle the case where there's no function name (just address)
         function = ""
@@ -205,6 +247,26 @@ def parse_stack_frame(line: str) -> Optional[Dict[str, Any]]:
         else:
             file = address
 
+    return function, file, address
+
+
+def parse_stack_frame(line: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a stack frame line and create a frame dictionary.
+
+    Args:
+        line: Stack frame line in the format "#N address in function file" or "#N address (module)"
+
+    Returns:
+        dict: Frame dictionary or None if the line couldn't be parsed
+    """
+    parsed_line = _parse_frame_line(line)
+
+    if parsed_line is None:
+        return None
+
+    function, file, address = parsed_line
+
     # Create a frame dictionary using the common function
     frame = create_frame(function, file)
 
@@ -214,7 +276,7 @@ def parse_stack_frame(line: str) -> Optional[Dict[str, Any]]:
     return frame
 
 
-def parse_reproduce_logs_to_dict(log_lines: List[str]) -> dict:
+def parse_reproduce_logs_to_dict(log_lines: Iterable[str]) -> dict:
     """
     Parse sanitizer output logs to extract error information and stack trace.
 
@@ -224,7 +286,7 @@ def parse_reproduce_logs_to_dict(log_lines: List[str]) -> dict:
     - Stack trace lines
 
     Args:
-        log_lines: List of strings containing the log output
+        log_lines: Lines of the log output, any iterable (e.g., a file object) is read in a single pass
 
     Returns:
         dict: Dictionary containing parsed information with keys like:
@@ -235,24 +297,28 @@ def parse_reproduce_logs_to_dict(log_lines: List[str]) -> dict:
             - stack: Dictionary with the structure expected by CrashInfo for deserialization
     """
     parsed = {}
+    # a single forward pass over the lines, they are never indexed
+    lines = iter(log_lines)
 
     # Find the error start line and extract description
-    start_idx, info = find_error_start(log_lines)
+    for line in lines:
+        info = parse_error_header(line)
 
-    if start_idx == -1:
+        if info:
+            parsed.update(info)
+            break
+    else:
         return parsed  # No error found
 
-    parsed.update(info)
-
     # Extract error information
-    error_info = extract_error_info(log_lines, start_idx)
-    parsed.update(error_info)
+    error_line = next(lines, None)
 
-    # Collect stack trace lines
-    trace_lines, _ = collect_stack_trace(log_lines, start_idx)
+    if error_line is not None:
+        parsed.update(parse_error_details(error_line))
+        lines = chain((error_line,), lines)
 
-    # Parse stack frames
-    frames = [frame for line in trace_lines if (frame := parse_stack_frame(line))]
+    # Parse the stack frames as the trace is scanned, continuing right after the header
+    frames = [frame for line in iter_stack_trace(lines) if (frame := parse_stack_frame(line))]
 
     # Create a stack dictionary if we have frames
     if frames:
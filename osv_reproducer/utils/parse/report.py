@@ -3,6 +3,22 @@ from typing import Dict, Any, Optional, List
 
 from osv_reproducer.utils.parse.common import create_frame, create_stack_dict
 
+IMPACT_PATTERN = re.compile(r'([A-Za-z\-]+)')
+OPERATION_SIZE_PATTERN = re.compile(r'([A-Z]+) (\d+)')
+OPERATION_PLACEHOLDER_PATTERN = re.compile(r'([A-Z]+) \{\*\}')
+OPERATION_PATTERN = re.compile(r'([A-Z]+)$')
+KEY_VALUE_PATTERN = re.compile(r'^([^:\n]+): (.*)$', re.MULTILINE)
+
+# old report labels mapped to the ones used by the current format
+REPORT_LABELS = {
+    "\n  \n": "\n\n",
+    "Recommended Security Severity: ": "Severity: ",
+    "Regressed: ": "Regressed url: ",
+    "Crash Revision: ": "Regressed url: ",
+    "Reproducer Testcase: ": "Testcase url: ",
+}
+REPORT_LABELS_PATTERN = re.compile("|".join(map(re.escape, REPORT_LABELS)))
+
 
 def parse_section(section: str) -> Dict[str, str]:
     """
@@ -14,17 +30,7 @@ def parse_section(section: str) -> Dict[str, str]:
     Returns:
         Dictionary of parsed key-value pairs
     """
-    parsed = {}
-
-    for line in section.split('\n'):
-        if not line:
-            continue
-
-        key, value = line.split(': ')
-        key = key.lower().replace(" ", "_")
-        parsed[key] = value
-
-    return parsed
+    return {key.lower().replace(" ", "_"): value for key, value in KEY_VALUE_PATTERN.findall(section)}
 
 
 def parse_crash_type(crash_type: str) -> Dict[str, Any]:
@@ -40,24 +46,24 @@ def parse_crash_type(crash_type: str) -> Dict[str, Any]:
     result = {}
 
     # Extract impact (e.g., "Heap-buffer-overflow")
-    impact_match = re.match(r'([A-Za-z\-]+)', crash_type)
+    impact_match = IMPACT_PATTERN.match(crash_type)
     if impact_match:
         result['impact'] = impact_match.group(1).lower()
 
     # Extract operation and size (e.g., "READ 8")
-    op_size_match = re.search(r'([A-Z]+) (\d+)', crash_type)
+    op_size_match = OPERATION_SIZE_PATTERN.search(crash_type)
     if op_size_match:
         result['operation'] = op_size_match.group(1)
         result['size'] = int(op_size_match.group(2))
     else:
         # Check for the {*} placeholder which means size unknown (set to None)
-        op_placeholder_match = re.search(r'([A-Z]+) \{\*\}', crash_type)
+        op_placeholder_match = OPERATION_PLACEHOLDER_PATTERN.search(crash_type)
         if op_placeholder_match:
             result['operation'] = op_placeholder_match.group(1)
             result['size'] = None
         else:
             # Extract operation only (e.g., "READ" in "UNKNOWN READ")
-            op_match = re.search(r'([A-Z]+)$', crash_type)
+            op_match = OPERATION_PATTERN.search(crash_type)
             if op_match:
                 result['operation'] = op_match.group(1)
                 result['size'] = None
@@ -106,12 +112,7 @@ def preprocess_report_text(text: str) -> str:
     Returns:
         Preprocessed text
     """
-    text_fmt = text.replace("\n  \n", "\n\n")
-    text_fmt = text_fmt.replace("Recommended Security Severity: ", "Severity: ")
-    text_fmt = text_fmt.replace("Regressed: ", "Regressed url: ")
-    text_fmt = text_fmt.replace("Crash Revision: ", "Regressed url: ")
-    text_fmt = text_fmt.replace("Reproducer Testcase: ", "Testcase url: ")
-    return text_fmt
+    return REPORT_LABELS_PATTERN.sub(lambda match: REPORT_LABELS[match.group(0)], text)
 
 
 def process_sections(sections: List[str]) -> Dict[str, str]:
@@ -191,14 +192,14 @@ def parse_oss_fuzz_report_to_dict(text: str) -> Dict[str, Any]:
 
     # Normalize old field names
     if 'fuzzer' in parsed and 'fuzzing_engine' not in parsed:
-        # the split is for cases such as 'libFuzzer_unrar_fuzzer'
-        parsed['fuzzing_engine'] = parsed.pop('fuzzer').split("_")[0]
+        # the partition is for cases such as 'libFuzzer_unrar_fuzzer'
+        parsed['fuzzing_engine'] = parsed.pop('fuzzer').partition("_")[0]
 
     if 'fuzz_target_binary' in parsed and 'fuzz_target' not in parsed:
         parsed['fuzz_target'] = parsed.pop('fuzz_target_binary')
 
     if 'sanitizer' in parsed:
-        parsed['sanitizer'] = parsed['sanitizer'].lower().split(" ")[0]
+        parsed['sanitizer'] = parsed['sanitizer'].lower().partition(" ")[0]
 
     # Extract crash info
     crash_info = extract_crash_info(parsed)
@@ -0,0 +1,71 @@
+import unittest
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from osv_reproducer.core.exc import OSVError
+from osv_reproducer.services.context import ContextService
+
+
+def make_context_service(**handlers) -> ContextService:
+    kwargs = {
+        name: handlers.get(name, MagicMock())
+        for name in ['file_provision_handler', 'gcs_handler', 'github_handler', 'oss_fuzz_handler', 'osv_handler']
+    }
+
+    return ContextService(**kwargs)
+
+
+class TestGetIssueReports(unittest.TestCase):
+    """Test cases for the ContextService.get_issue_reports method."""
+
+    def setUp(self):
+        self.issue_reports = {1: SimpleNamespace(id=1)}
+        self.file_provision_handler = MagicMock()
+        # both records are available locally, only OSV-1 maps to an issue
+        self.file_provision_handler.get_osv_record.side_effect = lambda osv_id: SimpleNamespace(
+            id=osv_id, references=[]
+        )
+        self.file_provision_handler.get_issue_id.side_effect = {'OSV-1': 1, 'OSV-2': None}.get
+        self.file_provision_handler.load_issue_report.side_effect = self.issue_reports.get
+        self.osv_handler = MagicMock()
+        self.osv_handler.fetch_vulnerabilities.return_value = {}
+
+        self.context_service = make_context_service(
+            file_provision_handler=self.file_provision_handler, osv_handler=self.osv_handler
+        )
+
+    def test_get_issue_reports_partial_failure(self):
+        """Test that records that cannot be resolved are left out without failing the others."""
+        result = self.context_service.get_issue_reports(['OSV-1', 'OSV-2'])
+
+        self.assertEqual(result, {'OSV-1': self.issue_reports[1]})
+        self.osv_handler.fetch_vulnerabilities.assert_called_once_with([], 8)
+
+    def test_get_issue_reports_handler_error(self):
+        """Test that a record failing with a handler error is left out without failing the others."""
+        def get_osv_record(osv_id):
+            return SimpleNamespace(id=osv_id, references=[]) if osv_id == 'OSV-1' else None
+
+        self.file_provision_handler.get_osv_record.side_effect = get_osv_record
+        self.osv_handler.fetch_vulnerability.side_effect = OSVError("HTTP 404")
+
+        result = self.context_service.get_issue_reports(['OSV-1', 'OSV-BAD'])
+
+        self.assertEqual(result, {'OSV-1': self.issue_reports[1]})
+
+    def test_get_issue_reports_repeated_ids(self):
+        """Test that repeated ids are resolved once."""
+        result = self.context_service.get_issue_reports(['OSV-1', 'OSV-1'])
+
+        self.assertEqual(result, {'OSV-1': self.issue_reports[1]})
+        self.file_provision_handler.load_issue_report.assert_called_once_with(1)
+
+    def test_get_issue_reports_empty(self):
+        """Test that no ids resolve to an empty dict without fetching anything."""
+        self.assertEqual(self.context_service.get_issue_reports([]), {})
+        self.osv_handler.fetch_vulnerabilities.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
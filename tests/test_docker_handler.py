@@ -0,0 +1,46 @@
+import unittest
+
+from unittest.mock import MagicMock
+
+from osv_reproducer.handlers.docker import DockerHandler
+
+
+class TestStreamContainerLogs(unittest.TestCase):
+    """Test cases for the DockerHandler.stream_container_logs method."""
+
+    def setUp(self):
+        self.handler = DockerHandler()
+        # the attributes _setup would initialize, without connecting to the Docker daemon
+        self.handler.app = MagicMock()
+        self.handler.client = MagicMock()
+        self.container = self.handler.client.containers.get.return_value
+
+    def _stream(self, chunks, max_lines=None):
+        self.container.logs.return_value = iter(chunks)
+        return self.handler.stream_container_logs("container", max_lines=max_lines)
+
+    def test_lines_split_across_chunks(self):
+        """Test that lines split across chunks are assembled before being logged."""
+        logs = self._stream([b"Running: /out/fuz", b"zer\nINFO: Seed: 1\n", b"\n", b"ERROR: Addr", b"essSanitizer"])
+
+        self.assertEqual(logs, ["Running: /out/fuzzer", "INFO: Seed: 1", "ERROR: AddressSanitizer"])
+
+    def test_multibyte_character_split_across_chunks(self):
+        """Test that a UTF-8 character split across chunks is decoded whole."""
+        line = "in função /src/ünïcode.c\n".encode("utf-8")
+        # split inside the two-byte encoding of 'ç'
+        split = line.index("ç".encode("utf-8")) + 1
+
+        logs = self._stream([line[:split], line[split:]])
+
+        self.assertEqual(logs, ["in função /src/ünïcode.c"])
+
+    def test_max_lines_keeps_the_tail(self):
+        """Test that only the last max_lines lines are kept."""
+        logs = self._stream([b"line 1\nline 2\nli", b"ne 3\nline 4\n"], max_lines=2)
+
+        self.assertEqual(logs, ["line 3", "line 4"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import orjson
+import tempfile
+import threading
+import unittest
+
+from pathlib import Path
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+
+from osv_reproducer.core.models import OSSFuzzIssueReport
+from osv_reproducer.handlers.file_provision import (
+    FileProvisionHandler, MODEL_CACHE_SIZE, _write_file_atomic, _lru_get, _lru_put
+)
+from osv_reproducer.utils.parse.report import parse_oss_fuzz_report_to_dict
+
+
+class TestWriteFileAtomic(unittest.TestCase):
+    """Test cases for the _write_file_atomic function."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self._tmp_dir.name)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_write_file_atomic(self):
+        """Test that the content is written and no temporary file is left behind."""
+        file_path = self.tmp_path / "record.json"
+        _write_file_atomic(file_path, b'{"id": 1}')
+
+        self.assertEqual(file_path.read_bytes(), b'{"id": 1}')
+        self.assertEqual(list(self.tmp_path.iterdir()), [file_path])
+
+    def test_write_file_atomic_concurrent_writers(self):
+        """Test that concurrent writers of the same file do not clobber each other's temporary file."""
+        file_path = self.tmp_path / "record.json"
+        contents = [str(i).encode() * 4096 for i in range(8)]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # raises if a writer's temporary file was moved away by another writer
+            list(executor.map(lambda content: _write_file_atomic(file_path, content), contents * 8))
+
+        self.assertIn(file_path.read_bytes(), contents)
+        self.assertEqual(list(self.tmp_path.iterdir()), [file_path])
+
+
+class TestSnapshotGeneration(unittest.TestCase):
+    """Test cases for the generation sidecar of the cached snapshots."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.handler = FileProvisionHandler(base_path=Path(self._tmp_dir.name))
+        self.handler.app = MagicMock()
+        self.handler._init_paths()
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_load_snapshot_generation(self):
+        """Test that the generation saved with the snapshot is loaded back."""
+        self.handler.save_snapshot({"/src/project": {}}, "project", "address", "202401010000", generation=7)
+
+        self.assertEqual(self.handler.load_snapshot_generation("project", "address", "202401010000"), 7)
+
+    def test_load_snapshot_generation_missing(self):
+        """Test that a snapshot without a sidecar has no generation and logs no warning."""
+        self.assertIsNone(self.handler.load_snapshot_generation("project", "address", "202401010000"))
+        self.handler.app.log.warning.assert_not_called()
+
+    def test_save_snapshot_without_generation_removes_stale_sidecar(self):
+        """Test that re-saving a snapshot without a generation drops the generation of the previous copy."""
+        self.handler.save_snapshot({"/src/project": {}}, "project", "address", "202401010000", generation=7)
+        self.handler.save_snapshot({"/src/project": {}}, "project", "address", "202401010000")
+
+        self.assertIsNone(self.handler.load_snapshot_generation("project", "address", "202401010000"))
+        self.assertEqual([path.name for path in self.handler.snapshots_path.iterdir()], ["project-address-202401010000.json"])
+
+
+class TestIssueReportValidators(unittest.TestCase):
+    """Test cases for the validators sidecar of the cached issue reports."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.handler = FileProvisionHandler(base_path=Path(self._tmp_dir.name))
+        self.handler.app = MagicMock()
+        self.handler._init_paths()
+
+        report_path = Path(__file__).parent.parent / 'data' / 'reports' / 'OSV-2017-104.txt'
+        self.issue_report = OSSFuzzIssueReport(id=42, **parse_oss_fuzz_report_to_dict(report_path.read_text()))
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def test_load_issue_report_validators(self):
+        """Test that the validators saved with the issue report are loaded back."""
+        self.handler.save_issue_report(self.issue_report, {"ETag": '"abc"'})
+
+        self.assertEqual(self.handler.load_issue_report_validators(42), {"ETag": '"abc"'})
+
+    def test_load_issue_report_validators_missing(self):
+        """Test that an issue report without a sidecar has no validators and logs no warning."""
+        self.assertIsNone(self.handler.load_issue_report_validators(42))
+        self.handler.app.log.warning.assert_not_called()
+
+    def test_save_issue_report_without_validators_removes_stale_sidecar(self):
+        """Test that re-saving an issue report without validators drops the validators of the previous response."""
+        self.handler.save_issue_report(self.issue_report, {"ETag": '"abc"'})
+        self.handler.save_issue_report(self.issue_report)
+
+        self.assertIsNone(self.handler.load_issue_report_validators(42))
+        self.assertEqual([path.name for path in self.handler.issues_path.iterdir()], ["42.json"])
+
+
+class TestMappings(unittest.TestCase):
+    """Test cases for the deferred writes of the mappings."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.handler = FileProvisionHandler(base_path=Path(self._tmp_dir.name))
+        self.handler.app = MagicMock()
+        self.handler._init_paths()
+
+    def tearDown(self):
+        self.handler._flush_mappings()
+        self._tmp_dir.cleanup()
+
+    def test_set_mappings_are_written_on_flush(self):
+        """Test that the updated mappings are only written to their files on flush."""
+        self.handler.set_issue_id("OSV-2017-104", 4242)
+        self.handler.set_oss_fuzz_repo_sha("202401010000", "abc")
+
+        self.assertEqual(self.handler.get_issue_id("OSV-2017-104"), 4242)
+        self.assertFalse(self.handler.osv_issue_ids_path.exists())
+
+        self.assertTrue(self.handler._flush_mappings())
+        self.assertEqual(orjson.loads(self.handler.osv_issue_ids_path.read_bytes()), {"OSV-2017-104": 4242})
+        self.assertEqual(orjson.loads(self.handler.timestamp_commit_ids_path.read_bytes()), {"202401010000": "abc"})
+        self.assertFalse(self.handler.osv_timestamp_ids_path.exists())
+
+    def test_failed_flush_keeps_mappings_pending(self):
+        """Test that a mapping that could not be written is written by the next flush."""
+        self.handler.set_osv_timestamp("OSV-2017-104", "202401010000")
+
+        with patch("osv_reproducer.handlers.file_provision._write_file_atomic", side_effect=OSError("disk full")):
+            self.assertFalse(self.handler._flush_mappings())
+
+        self.handler.app.log.error.assert_called_once()
+        self.assertTrue(self.handler._flush_mappings())
+        self.assertEqual(
+            orjson.loads(self.handler.osv_timestamp_ids_path.read_bytes()), {"OSV-2017-104": "202401010000"}
+        )
+
+
+class TestLRUCache(unittest.TestCase):
+    """Test cases for the _lru_get and _lru_put functions."""
+
+    def setUp(self):
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+        for key in range(MODEL_CACHE_SIZE):
+            _lru_put(self.cache, self.lock, key, str(key))
+
+    def test_evicts_least_recently_put(self):
+        """Test that putting into a full cache evicts the oldest entry."""
+        _lru_put(self.cache, self.lock, MODEL_CACHE_SIZE, "new")
+
+        self.assertEqual(len(self.cache), MODEL_CACHE_SIZE)
+        self.assertIsNone(_lru_get(self.cache, self.lock, 0))
+        self.assertEqual(_lru_get(self.cache, self.lock, MODEL_CACHE_SIZE), "new")
+
+    def test_get_marks_as_recently_used(self):
+        """Test that a looked up entry is not the next one evicted."""
+        self.assertEqual(_lru_get(self.cache, self.lock, 0), "0")
+
+        _lru_put(self.cache, self.lock, MODEL_CACHE_SIZE, "new")
+
+        self.assertEqual(_lru_get(self.cache, self.lock, 0), "0")
+        self.assertIsNone(_lru_get(self.cache, self.lock, 1))
+
+    def test_put_existing_key_does_not_evict(self):
+        """Test that replacing a cached value does not evict another entry."""
+        _lru_put(self.cache, self.lock, 0, "replaced")
+
+        self.assertEqual(len(self.cache), MODEL_CACHE_SIZE)
+        self.assertEqual(_lru_get(self.cache, self.lock, 0), "replaced")
+        self.assertEqual(_lru_get(self.cache, self.lock, 1), "1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import time
+import tempfile
+import functools
+import threading
+import unittest
+
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+from concurrent.futures import ThreadPoolExecutor
+
+from git import GitCommandError
+from gitlib.common.exceptions import GitLibException
+
+from osv_reproducer.handlers.github import GithubHandler
+
+
+class TestCloneRepository(unittest.TestCase):
+    """Test cases for the GithubHandler.clone_repository method."""
+
+    def setUp(self):
+        self.handler = GithubHandler()
+        # the attributes _setup would initialize, without connecting to GitHub
+        self.handler._clone_locks = {}
+        self.handler._clone_locks_lock = threading.Lock()
+
+        self.active = {}
+        self.max_active = {}
+        self.counter_lock = threading.Lock()
+
+        def _clone_repository(repo_url, commit, to_path, shallow):
+            with self.counter_lock:
+                self.active[to_path] = self.active.get(to_path, 0) + 1
+                self.max_active[to_path] = max(self.max_active.get(to_path, 0), self.active[to_path])
+
+            time.sleep(0.05)
+
+            with self.counter_lock:
+                self.active[to_path] -= 1
+
+            return to_path
+
+        self.handler._clone_repository = _clone_repository
+
+    def test_clone_repository_same_path_is_serialized(self):
+        """Test that concurrent clones into the same directory do not run at the same time."""
+        to_path = Path("/tmp/repositories/owner/repo/abc")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda _: self.handler.clone_repository("https://github.com/owner/repo", "abc", to_path), range(4)
+            ))
+
+        self.assertEqual(results, [to_path] * 4)
+        self.assertEqual(self.max_active[to_path], 1)
+
+    def test_clone_repository_different_paths_run_concurrently(self):
+        """Test that clones into different directories are not serialized."""
+        to_paths = [Path(f"/tmp/repositories/owner/repo/{rev}") for rev in ("abc", "def")]
+        barrier = threading.Barrier(2, timeout=5)
+        clone_repository = self.handler._clone_repository
+
+        def _clone_repository(repo_url, commit, to_path, shallow):
+            # both clones must be inside at the same time to pass the barrier
+            barrier.wait()
+            return clone_repository(repo_url, commit, to_path, shallow)
+
+        self.handler._clone_repository = _clone_repository
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(
+                lambda to_path: self.handler.clone_repository("https://github.com/owner/repo", "rev", to_path), to_paths
+            ))
+
+        self.assertEqual(results, to_paths)
+
+
+class TestShallowCloneFallback(unittest.TestCase):
+    """Test cases for the fallbacks of the shallow clone in GithubHandler._clone_repository."""
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self.to_path = Path(self._tmp_dir.name) / "repo"
+
+        self.handler = GithubHandler()
+        self.handler.app = MagicMock()
+
+        self.repo = MagicMock()
+        patcher = patch("osv_reproducer.handlers.github.git.Repo.init", return_value=self.repo)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _fail_shallow_fetch(self, stderr: str):
+        def fetch(*args, **kwargs):
+            if kwargs.get("depth"):
+                raise GitCommandError(["git", "fetch"], 128, stderr=stderr)
+
+        self.repo.git.fetch.side_effect = fetch
+
+    def test_unadvertised_commit_fetches_without_blobs(self):
+        """Test that a server rejecting the unadvertised commit falls back to a blob-less full fetch."""
+        self._fail_shallow_fetch("fatal: remote error: upload-pack: not our ref abc")
+
+        result = self.handler._clone_repository("https://github.com/owner/repo", "abc", self.to_path, True)
+
+        self.assertEqual(result, self.to_path)
+        self.assertEqual(self.repo.git.fetch.call_args, call("origin", filter="blob:none"))
+        self.repo.git.checkout.assert_called_once_with("abc")
+
+    def test_no_shallow_support_fetches_everything(self):
+        """Test that a server without shallow support falls back to a full fetch."""
+        self._fail_shallow_fetch("fatal: dumb http transport does not support shallow capabilities")
+
+        result = self.handler._clone_repository("https://example.com/repo.git", "abc", self.to_path, True)
+
+        self.assertEqual(result, self.to_path)
+        self.assertEqual(self.repo.git.fetch.call_args, call("origin"))
+        self.repo.git.checkout.assert_called_once_with("abc")
+
+    def test_other_errors_are_not_retried(self):
+        """Test that other fetch errors (e.g., a missing commit) do not trigger a full-history fetch."""
+        self._fail_shallow_fetch("fatal: couldn't find remote ref abc")
+
+        result = self.handler._clone_repository("https://github.com/owner/repo", "abc", self.to_path, True)
+
+        self.assertIsNone(result)
+        self.repo.git.fetch.assert_called_once_with("origin", "abc", depth=1)
+        self.repo.git.checkout.assert_not_called()
+
+
+class TestGetRepo(unittest.TestCase):
+    """Test cases for the memoized GithubHandler._get_repo lookups."""
+
+    def setUp(self):
+        self.handler = GithubHandler()
+        # the attributes _setup would initialize, without connecting to GitHub
+        self.handler.app = MagicMock()
+        self.handler.client = MagicMock()
+        self.handler._get_cached_repo = functools.lru_cache(maxsize=1024)(self.handler._fetch_repo)
+
+    def test_successful_lookup_is_cached(self):
+        """Test that a found repository is fetched once."""
+        repo = self.handler.client.get_repo.return_value
+
+        self.assertIs(self.handler._get_repo("google", "oss-fuzz"), repo)
+        self.assertIs(self.handler._get_repo("google", "oss-fuzz"), repo)
+        self.handler.client.get_repo.assert_called_once_with("google", "oss-fuzz", raise_err=True)
+
+    def test_failed_lookup_is_retried(self):
+        """Test that a failed lookup (e.g., rate limit) is not cached as a miss."""
+        repo = MagicMock()
+        self.handler.client.get_repo.side_effect = [GitLibException("Rate limit exhausted"), repo]
+
+        self.assertIsNone(self.handler._get_repo("google", "oss-fuzz"))
+        self.assertIs(self.handler._get_repo("google", "oss-fuzz"), repo)
+        self.assertIs(self.handler._get_repo("google", "oss-fuzz"), repo)
+        self.assertEqual(self.handler.client.get_repo.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from pydantic import HttpUrl
+
+from osv_reproducer.handlers.oss_fuzz import OSSFuzzHandler
+
+VALIDATORS = {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+
+def read_report_file(filename):
+    """Read a report file and return its contents."""
+    report_path = Path(__file__).parent.parent / 'data' / 'reports' / filename
+    return report_path.read_text()
+
+
+def make_issue_page(report: str) -> bytes:
+    """Embed the report in an issue page, escaped as the issue tracker does."""
+    return b'<html>["Detailed Report: ' + report.encode('unicode_escape') + b'Issue filed automatically.\\n"]</html>'
+
+
+class TestFetchIssueReportIfModified(unittest.TestCase):
+    """Test cases for the OSSFuzzHandler.fetch_issue_report_if_modified method."""
+
+    def setUp(self):
+        self.handler = OSSFuzzHandler()
+        # the attributes _setup would initialize, without any network access
+        self.handler.app = MagicMock()
+        self.handler.base_url = HttpUrl("https://issues.oss-fuzz.com")
+        self.handler.session = MagicMock()
+
+    def test_not_modified(self):
+        """Test that a 304 response returns no report and the given validators."""
+        self.handler.session.get.return_value = SimpleNamespace(status_code=304, headers={}, content=b"")
+
+        report, validators = self.handler.fetch_issue_report_if_modified(42, VALIDATORS)
+
+        self.assertIsNone(report)
+        self.assertEqual(validators, VALIDATORS)
+
+        # the validators are sent as conditional request headers
+        _, kwargs = self.handler.session.get.call_args
+        self.assertEqual(kwargs["headers"], {
+            "If-None-Match": VALIDATORS["ETag"], "If-Modified-Since": VALIDATORS["Last-Modified"]
+        })
+
+    def test_modified(self):
+        """Test that a 200 response returns the parsed report and the validators of the response."""
+        self.handler.session.get.return_value = SimpleNamespace(
+            status_code=200, headers={"ETag": '"def"', "Content-Type": "text/html"},
+            content=make_issue_page(read_report_file('OSV-2017-104.txt'))
+        )
+
+        report, validators = self.handler.fetch_issue_report_if_modified(42, VALIDATORS)
+
+        self.assertEqual(report.id, 42)
+        self.assertEqual(report.project, 'unrar')
+        self.assertEqual(report.crash_info.impact, 'heap-buffer-overflow')
+        self.assertEqual(validators, {"ETag": '"def"'})
+
+    def test_unconditional_request(self):
+        """Test that no conditional headers are sent without validators."""
+        self.handler.session.get.return_value = SimpleNamespace(status_code=404, headers={}, content=b"")
+
+        self.assertEqual(self.handler.fetch_issue_report_if_modified(42), (None, None))
+
+        _, kwargs = self.handler.session.get.call_args
+        self.assertEqual(kwargs["headers"], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from osv_reproducer.utils.parse.arguments import parse_key_value_string
+
+
+class TestParseKeyValueString(unittest.TestCase):
+    """Test cases for the parse_key_value_string function."""
+
+    def test_parse_key_value_string(self):
+        """Test parsing key-value pairs separated by '|'."""
+        self.assertEqual(parse_key_value_string("SANITIZER:address|ARCHITECTURE:x86_64"), {
+            "SANITIZER": "address", "ARCHITECTURE": "x86_64"
+        })
+
+    def test_parse_key_value_string_with_whitespace(self):
+        """Test that whitespace around keys and values is stripped."""
+        self.assertEqual(parse_key_value_string(" SANITIZER : address | FUZZING_ENGINE: libfuzzer "), {
+            "SANITIZER": "address", "FUZZING_ENGINE": "libfuzzer"
+        })
+
+    def test_parse_key_value_string_with_colon_in_value(self):
+        """Test that values containing ':' (e.g., URLs) are kept whole."""
+        self.assertEqual(parse_key_value_string("URL:https://example.com:8080/path|MODE:crash"), {
+            "URL": "https://example.com:8080/path", "MODE": "crash"
+        })
+
+    def test_parse_key_value_string_with_empty_value(self):
+        """Test that a key without a value maps to an empty string."""
+        self.assertEqual(parse_key_value_string("SANITIZER:|MODE:crash"), {"SANITIZER": "", "MODE": "crash"})
+
+    def test_parse_key_value_string_with_missing_key(self):
+        """Test that pairs without a key or without a ':' are skipped."""
+        self.assertEqual(parse_key_value_string(":address|MODE:crash|invalid"), {"MODE": "crash"})
+
+    def test_parse_key_value_string_with_empty_string(self):
+        """Test parsing an empty string."""
+        self.assertEqual(parse_key_value_string(""), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+
+from osv_reproducer.utils.parse.dockerfile import parse_instruction, parse_mount_sources
+
+
+class TestParseInstruction(unittest.TestCase):
+    """Test cases for the parse_instruction function."""
+
+    def test_parse_instruction(self):
+        """Test splitting an instruction into its sources and destination."""
+        self.assertEqual(parse_instruction("COPY build.sh fuzzer.c $SRC/"), (["build.sh", "fuzzer.c"], "$SRC/"))
+
+    def test_parse_instruction_with_repeated_whitespace(self):
+        """Test that repeated whitespace between arguments does not produce empty parts."""
+        self.assertEqual(parse_instruction("COPY   build.sh \t $SRC/"), (["build.sh"], "$SRC/"))
+
+    def test_parse_instruction_with_quoted_paths(self):
+        """Test that quoted paths with spaces are kept as a single argument."""
+        self.assertEqual(
+            parse_instruction('COPY "my fuzzer.c" \'seed corpus.zip\' $SRC/'),
+            (["my fuzzer.c", "seed corpus.zip"], "$SRC/")
+        )
+
+    def test_parse_instruction_with_unbalanced_quotes(self):
+        """Test that unbalanced quotes fall back to plain whitespace splitting."""
+        self.assertEqual(parse_instruction('COPY "build.sh $SRC/'), (['"build.sh'], "$SRC/"))
+
+
+class TestParseMountSources(unittest.TestCase):
+    """Test cases for the parse_mount_sources function."""
+
+    def test_parse_mount_sources(self):
+        """Test separating the downloadable and mountable sources of a Dockerfile."""
+        dockerfile = [
+            "FROM gcr.io/oss-fuzz-base/base-builder",
+            "RUN git clone --depth 1 https://github.com/owner/repo repo",
+            "  COPY build.sh $SRC/",
+            'COPY "fuzz target.c" $SRC/repo/',
+            "ADD https://example.com/dict.txt $SRC/dict.txt",
+            "COPY *.options $SRC/",
+            "COPY config $OUT/",
+        ]
+
+        downloadable_files, mount_files = parse_mount_sources(dockerfile)
+
+        self.assertEqual(downloadable_files, {"https://example.com/dict.txt": "/src/dict.txt"})
+        self.assertEqual(mount_files, {"build.sh": "/src/build.sh", "fuzz target.c": "/src/repo/fuzz target.c"})
+
+    def test_parse_mount_sources_with_empty_dockerfile(self):
+        """Test parsing an empty Dockerfile."""
+        self.assertEqual(parse_mount_sources([]), ({}, {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -214,6 +214,15 @@ class TestParseLog(unittest.TestCase):
                 self.assertEqual(result.get('address'), expected['address'])
                 self.assertNotIn('stack', result)
 
+    def test_parse_reproduce_output_from_iterator(self):
+        """Test parsing log output consumed from a single-pass iterator."""
+        for filename in LOG_FILES:
+            with self.subTest(filename=filename):
+                log_lines = read_log_file(filename)
+
+                # Should parse the same as the materialized list
+                self.assertEqual(parse_reproduce_logs_to_dict(iter(log_lines)), parse_reproduce_logs_to_dict(log_lines))
+
 
 if __name__ == '__main__':
     unittest.main()
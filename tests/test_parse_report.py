@@ -1,7 +1,7 @@
 import unittest
 from pathlib import Path
 
-from osv_reproducer.utils.parse.report import parse_oss_fuzz_report_to_dict
+from osv_reproducer.utils.parse.report import parse_oss_fuzz_report_to_dict, parse_section
 
 # Global configuration for test data
 REPORT_FILES = {
@@ -218,6 +218,30 @@ class TestParseReport(unittest.TestCase):
         self.assertEqual(result.get('project'), REPORT_FILES[filename]['project'])
         self.assertNotIn('crash_info', result)  # crash_info should not be created without stack
 
+    def test_parse_report_with_empty_values(self):
+        """Test parsing report with fields that have an empty value."""
+        filename = list(REPORT_FILES.keys())[0]
+        original_content = read_report_file(filename)
+        report_content = original_content.replace(
+            f"Crash Address: {REPORT_FILES[filename]['address']}", "Crash Address: "
+        )
+        result = parse_oss_fuzz_report_to_dict(report_content)
+
+        # The empty address is kept instead of dropping the field
+        self.assertIn('crash_info', result)
+        self.assertEqual(result['crash_info']['address'], '')
+        self.assertEqual(result['crash_info']['impact'], REPORT_FILES[filename]['impact'])
+
+    def test_parse_section_with_empty_values(self):
+        """Test parsing a section whose fields have empty values or values containing ':'."""
+        result = parse_section("Crash Address: \nRegressed: \nTestcase url: https://oss-fuzz.com/download")
+
+        self.assertEqual(result, {
+            'crash_address': '',
+            'regressed': '',
+            'testcase_url': 'https://oss-fuzz.com/download',
+        })
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,72 @@
+import time
+import threading
+import unittest
+
+from unittest.mock import MagicMock, patch
+
+from osv_reproducer.core.common.enums import ReproductionMode
+from osv_reproducer.services.reproducer import ReproducerService
+
+
+class TestReproducerServiceBatch(unittest.TestCase):
+    """Test cases for the ReproducerService.batch method."""
+
+    def setUp(self):
+        self.active = {}
+        self.max_active = {}
+        self.calls = []
+        self.lock = threading.Lock()
+
+        def _context(osv_id, mode):
+            with self.lock:
+                self.calls.append((osv_id, mode))
+                self.active[osv_id] = self.active.get(osv_id, 0) + 1
+                self.max_active[osv_id] = max(self.max_active.get(osv_id, 0), self.active[osv_id])
+
+            time.sleep(0.05)
+
+            with self.lock:
+                self.active[osv_id] -= 1
+
+            return True
+
+        self.context_service = MagicMock(side_effect=_context)
+        self.reproducer_service = ReproducerService(
+            context_service=self.context_service, builder_service=MagicMock(return_value=True),
+            runner_service=MagicMock(return_value=True), verifier_service=MagicMock(return_value=True)
+        )
+
+    def test_batch_same_osv_id_two_modes(self):
+        """Test that both modes of one OSV ID run, one after the other."""
+        items = [('OSV-1', ReproductionMode.CRASH), ('OSV-1', ReproductionMode.FIX)]
+        results = self.reproducer_service.batch(items)
+
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(result.verifier_ok for result in results))
+        self.assertEqual(self.calls, items)
+        self.assertEqual(self.max_active['OSV-1'], 1)
+        self.context_service.get_issue_reports.assert_called_once_with(['OSV-1'], max_workers=4)
+
+    def test_batch_keeps_item_order_and_duplicates(self):
+        """Test that results follow the items and duplicated pairs are processed once."""
+        items = [('OSV-2', ReproductionMode.CRASH), ('OSV-1', ReproductionMode.CRASH), ('OSV-2', ReproductionMode.CRASH)]
+        results = self.reproducer_service.batch(items)
+
+        self.assertEqual(len(results), 3)
+        self.assertIs(results[0], results[2])
+        self.assertEqual(len(self.calls), 2)
+
+    def test_batch_prefetch_failure_is_not_fatal(self):
+        """Test that a failure while prefetching the issue reports does not stop the pipelines."""
+        self.context_service.get_issue_reports.side_effect = RuntimeError("network down")
+
+        with patch('builtins.print') as mock_print:
+            results = self.reproducer_service.batch([('OSV-1', ReproductionMode.CRASH)])
+
+        self.assertTrue(results[0].verifier_ok)
+        # the failure is reported instead of silently discarded
+        mock_print.assert_any_call("Could not prefetch the issue reports: network down")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from osv_reproducer.core.exc import VerifierError
+from osv_reproducer.core.models import CrashInfo
+from osv_reproducer.core.common.enums import ReproductionMode
+from osv_reproducer.services.verifier import VerifierService, _compute_stack_shift, _check_stack_frames, _frame_names
+from osv_reproducer.utils.parse.common import create_frame, create_stack_dict
+
+REPORT_FRAMES = ('Unpack::CopyString', 'Unpack::Unpack5', 'CmdExtract::ExtractCurrentFile')
+
+
+def make_crash_info(functions, impact='heap-buffer-overflow', operation='WRITE') -> CrashInfo:
+    """Create a crash info with a stack made of the given functions."""
+    frames = [create_frame(function) for function in functions]
+    return CrashInfo(impact=impact, operation=operation, stack=create_stack_dict(frames))
+
+
+class TestFrameNames(unittest.TestCase):
+    """Test cases for the _frame_names function."""
+
+    def test_frame_names(self):
+        """Test that the function names of the stack frames are extracted in order."""
+        self.assertEqual(_frame_names(make_crash_info(REPORT_FRAMES)), REPORT_FRAMES)
+
+
+class TestComputeStackShift(unittest.TestCase):
+    """Test cases for the _compute_stack_shift function."""
+
+    def test_no_shift_when_first_frames_match(self):
+        """Test that matching first frames do not shift the crash stack."""
+        self.assertEqual(_compute_stack_shift(REPORT_FRAMES, REPORT_FRAMES), 0)
+
+    def test_shift_past_sanitizer_frames(self):
+        """Test that the crash stack is shifted past the frames missing from the report (e.g., __asan_memcpy)."""
+        crash_frames = ('__asan_memcpy', '__interceptor_memcpy') + REPORT_FRAMES
+
+        self.assertEqual(_compute_stack_shift(REPORT_FRAMES, crash_frames), 2)
+
+    def test_no_matching_frame(self):
+        """Test that a crash stack without the first report frame cannot be shifted."""
+        with self.assertRaises(VerifierError):
+            _compute_stack_shift(REPORT_FRAMES, ('__asan_memcpy', 'main'))
+
+    def test_single_frame_is_not_shifted(self):
+        """Test that a single frame crash stack is compared as is."""
+        self.assertEqual(_compute_stack_shift(REPORT_FRAMES, ('main',)), 0)
+
+
+class TestCheckStackFrames(unittest.TestCase):
+    """Test cases for the _check_stack_frames function."""
+
+    def test_shifted_frames_match(self):
+        """Test that the frames are compared after the shift."""
+        crash_frames = ('__asan_memcpy',) + REPORT_FRAMES
+
+        self.assertEqual(_check_stack_frames(REPORT_FRAMES, crash_frames, 1), list(REPORT_FRAMES))
+
+    def test_not_enough_matching_frames(self):
+        """Test that fewer matching frames than required raise an error."""
+        with self.assertRaises(VerifierError):
+            _check_stack_frames(REPORT_FRAMES, ('main', 'LLVMFuzzerTestOneInput'), 0)
+
+    def test_no_frames(self):
+        """Test that empty stacks cannot be compared."""
+        with self.assertRaises(VerifierError):
+            _check_stack_frames(REPORT_FRAMES, (), 0)
+
+
+class TestVerifierService(unittest.TestCase):
+    """Test cases for the VerifierService class."""
+
+    def setUp(self):
+        self.file_provision_handler = MagicMock()
+        self.verifier = VerifierService(self.file_provision_handler)
+        self.report_crash_info = make_crash_info(REPORT_FRAMES)
+
+        self.file_provision_handler.load_context.return_value = SimpleNamespace(
+            id='OSV-2017-104', mode=ReproductionMode.CRASH,
+            issue_report=SimpleNamespace(crash_info=self.report_crash_info)
+        )
+
+    def test_identical_crash_short_circuits(self):
+        """Test that a crash identical to the reported one is verified without comparing the stacks."""
+        self.file_provision_handler.load_crash_info.return_value = make_crash_info(REPORT_FRAMES)
+
+        with patch('osv_reproducer.services.verifier._compute_stack_shift') as compute_stack_shift:
+            self.assertTrue(self.verifier('OSV-2017-104', ReproductionMode.CRASH))
+
+        compute_stack_shift.assert_not_called()
+
+    def test_shifted_crash(self):
+        """Test that a crash with extra sanitizer frames on top is verified, resolving each stack's names once."""
+        self.file_provision_handler.load_crash_info.return_value = make_crash_info(('__asan_memcpy',) + REPORT_FRAMES)
+
+        with patch('osv_reproducer.services.verifier._frame_names', wraps=_frame_names) as frame_names:
+            self.assertTrue(self.verifier('OSV-2017-104', ReproductionMode.CRASH))
+
+        # once for the report stack and once for the crash stack
+        self.assertEqual(frame_names.call_count, 2)
+
+    def test_impact_mismatch(self):
+        """Test that a crash with a different impact is not verified."""
+        self.file_provision_handler.load_crash_info.return_value = make_crash_info(
+            REPORT_FRAMES, impact='stack-buffer-overflow'
+        )
+
+        with self.assertRaises(VerifierError):
+            self.verifier('OSV-2017-104', ReproductionMode.CRASH)
+
+    def test_crash_not_reproduced(self):
+        """Test that a missing crash in crash mode is not verified."""
+        self.file_provision_handler.load_crash_info.return_value = None
+
+        with self.assertRaises(VerifierError):
+            self.verifier('OSV-2017-104', ReproductionMode.CRASH)
+
+
+if __name__ == '__main__':
+    unittest.main()